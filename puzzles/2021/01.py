@@ -9,14 +9,14 @@ YEAR, DAY = 2021, 1
 
 
 def solve(test: bool = False):
-    input_data = reader.read_lines2(YEAR, DAY, test)
+    input_data = reader.iter_lines2(YEAR, DAY, test)
     heights = process(input_data)
     count_successive_increasing(heights)
     count_aggregated_increasing(heights)
 
 
 @tools.solution(part=0)
-def process(input_data: list[str]) -> list[int]:
+def process(input_data: Iterable[str]) -> list[int]:
     return [int(line) for line in input_data]
 
 
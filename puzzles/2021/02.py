@@ -1,6 +1,6 @@
 """Advent of Code 2021 Day 2: Dive!"""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from functools import reduce
@@ -56,14 +56,14 @@ class AimingMovingPoint:
 
 
 def solve():
-    input_data = reader.read_lines2(YEAR, DAY, test=TEST)
+    input_data = reader.iter_lines2(YEAR, DAY, test=TEST)
     instructions = parse_input_data(input_data)
     calculate_displacement(instructions)
     calculate_aimed_displacement(instructions)
 
 
 @tools.solution(part=0)
-def parse_input_data(input_data: list[str]) -> list[Instruction]:
+def parse_input_data(input_data: Iterable[str]) -> list[Instruction]:
     return [Instruction.parse_text(line) for line in input_data]
 
 
@@ -1,7 +1,7 @@
 """Advent of Code 2021 Day 4: Giant Squid"""
 
 import itertools as it
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Self
@@ -54,16 +54,17 @@ class BingoBoard:
 
 
 def solve():
-    input_data = reader.read_lines2(YEAR, DAY, test=TEST)
+    input_data = reader.iter_blocks2(YEAR, DAY, test=TEST)
     ranked_bingo_boards = rank_bingo_boards(input_data)
     score_first_to_win(ranked_bingo_boards)
     score_last_to_win(ranked_bingo_boards)
 
 
 @tools.solution(part=0)
-def rank_bingo_boards(input_data: list[str]) -> list[BingoBoard]:
-    call_order = parse_call_order(input_data[0])
-    bingo_boards = parse_bingo_boards(input_data[2:], call_order)
+def rank_bingo_boards(input_data: Iterable[list[str]]) -> list[BingoBoard]:
+    blocks = iter(input_data)
+    call_order = parse_call_order(next(blocks)[0])
+    bingo_boards = parse_bingo_boards(blocks, call_order)
 
     return sorted(bingo_boards, key=lambda bb: bb.winning_turn)
 
@@ -73,13 +74,9 @@ def parse_call_order(line: str) -> dict[str, int]:
 
 
 def parse_bingo_boards(
-    lines: list[str], call_order: dict[str, int]
+    blocks: Iterable[list[str]], call_order: dict[str, int]
 ) -> list[BingoBoard]:
-    return [
-        BingoBoard.parse_lines(g, call_order)
-        for k, g in it.groupby(lines, lambda x: x != "")
-        if k
-    ]
+    return [BingoBoard.parse_lines(iter(block), call_order) for block in blocks]
 
 
 @tools.solution(part=1)
@@ -1,23 +1,26 @@
 """Advent of Code 2021 Day 6: Lanternfish"""
 
-import re
 from collections import Counter
 
+import numpy as np
+
 from advent_of_code import reader, tools
 
 YEAR, DAY, TEST = 2021, 6, False
 
 
 def solve():
-    input_data = reader.read2(YEAR, DAY, test=TEST)
+    input_data = reader.read_ints(YEAR, DAY, test=TEST)
     inital_state = parse_input_data(input_data)
     simulate_80(inital_state)
     simulate_256(inital_state)
 
 
 @tools.solution(part=0)
-def parse_input_data(input_data: str) -> Counter[int]:
-    return Counter(int(d) for d in re.findall(r"\d+", input_data))
+def parse_input_data(input_data: np.ndarray) -> Counter[int]:
+    timers, counts = np.unique(input_data, return_counts=True)
+
+    return Counter(dict(zip(timers.tolist(), counts.tolist())))
 
 
 @tools.solution(part=1)
@@ -1,24 +1,25 @@
 """Advent of Code 2021 Day 7: The Treachery of Whales"""
 
-import re
 from math import ceil, floor
 from statistics import mean, median
 
+import numpy as np
+
 from advent_of_code import reader, tools
 
 YEAR, DAY, TEST = 2021, 7, False
 
 
 def solve():
-    input_data = reader.read2(YEAR, DAY, test=TEST)
+    input_data = reader.read_ints(YEAR, DAY, test=TEST)
     initial_positions = parse_input_data(input_data)
     minimize_constant_fuel_cost(initial_positions)
     minimize_linear_fuel_cost(initial_positions)
 
 
 @tools.solution(part=0)
-def parse_input_data(input_data: str) -> list[int]:
-    return [int(d) for d in re.findall(r"\d+", input_data)]
+def parse_input_data(input_data: np.ndarray) -> list[int]:
+    return input_data.tolist()
 
 
 @tools.solution(part=1)
@@ -8,7 +8,7 @@ YEAR, DAY, TEST = 2021, 8, False
 
 
 def solve():
-    input_data = reader.read_lines2(YEAR, DAY, test=TEST)
+    input_data = reader.iter_lines2(YEAR, DAY, test=TEST)
     patterns, display_digits = parse_input_data(input_data)
     part1(display_digits)
     part2(display_digits, patterns)
@@ -16,7 +16,7 @@ def solve():
 
 @tools.solution(part=0)
 def parse_input_data(
-    input_data: list[str],
+    input_data: Iterable[str],
 ) -> tuple[list[list[set[str]]], list[list[str]]]:
     seven_digit_displays = [line.split(" | ") for line in input_data]
     patterns_str, display_patterns_str = zip(*seven_digit_displays)
@@ -2,7 +2,7 @@
 
 from math import prod
 
-import networkx as nx
+import numpy as np
 
 from advent_of_code import grid_utils as gru
 from advent_of_code import reader, tools
@@ -11,51 +11,35 @@ YEAR, DAY, TEST = 2021, 9, False
 
 
 def solve():
-    input_data = reader.read_lines2(YEAR, DAY, test=TEST)
-    height_map = build_graph(input_data)
+    input_data = reader.read_grid(YEAR, DAY, test=TEST, digits=True)
+    height_map = parse_height_map(input_data)
     risk_level(height_map)
     find_largest_three_basins(height_map)
 
 
 @tools.solution(part=0)
-def build_graph(input_data: list[str]) -> nx.DiGraph:
-    digraph = nx.DiGraph()
-    node_generator = gru.generate_point_values(input_data)
-    for p, val in node_generator:
-        if val == "9":
-            continue
-
-        digraph.add_node(p, height=int(val))
-
-    for u, v in gru.generate_edges(input_data):
-        if not all(n in digraph for n in (u, v)):
-            continue
-
-        if digraph.nodes[u]["height"] > digraph.nodes[v]["height"]:
-            digraph.add_edge(u, v)
-
-        if digraph.nodes[v]["height"] > digraph.nodes[u]["height"]:
-            digraph.add_edge(v, u)
-
-    return digraph
+def parse_height_map(input_data: np.ndarray) -> gru.Grid:
+    return gru.Grid.from_numpy(input_data, typecode="b")
 
 
 @tools.solution(part=1)
-def risk_level(height_map: nx.DiGraph) -> int:
+def risk_level(height_map: gru.Grid) -> int:
+    r, c = height_map.shape
+    heights = height_map.data
     risk = 0
-    for u, out in height_map.out_degree:
-        if out >= 1:
+    for k, height in enumerate(heights):
+        if height == 9:
             continue
 
-        risk += height_map.nodes[u]["height"] + 1
+        if all(heights[n] >= height for n in gru.get_packed_neighbors(k, r, c)):
+            risk += height + 1
 
     return risk
 
 
 @tools.solution(part=2)
-def find_largest_three_basins(height_map: nx.DiGraph) -> int:
-    graph = nx.Graph(height_map.edges)
-    basins = [len(basin) for basin in nx.connected_components(graph)]
+def find_largest_three_basins(height_map: gru.Grid) -> int:
+    _, basins = gru.label_components(height_map, lambda height: height != 9)
 
     return prod(sorted(basins, reverse=True)[:3])
 
@@ -1,6 +1,7 @@
 """Advent of Code 2021 Day 10: Syntax Scoring"""
 
 import functools
+from collections.abc import Iterable
 from statistics import median
 
 from advent_of_code import reader, tools
@@ -14,18 +15,17 @@ AUTOCOMPLETE = {b: i for i, b in enumerate("([{<", start=1)}
 
 
 def solve():
-    input_data = reader.read_lines2(YEAR, DAY, test=TEST)
-    calculate_corruption_score(input_data)
-    calculate_autocompletion_score(input_data)
+    calculate_corruption_score(reader.iter_lines2(YEAR, DAY, test=TEST))
+    calculate_autocompletion_score(reader.iter_lines2(YEAR, DAY, test=TEST))
 
 
 @tools.solution(part=1)
-def calculate_corruption_score(input_data: list[str]) -> int:
+def calculate_corruption_score(input_data: Iterable[str]) -> int:
     return sum(corruption_score(line)[0] for line in input_data)
 
 
 @tools.solution(part=2)
-def calculate_autocompletion_score(input_data: list[str]) -> int:
+def calculate_autocompletion_score(input_data: Iterable[str]) -> int:
     auto_scores = [autocompletion_score(line) for line in input_data]
 
     return int(median(score for score in auto_scores if score != 0))
@@ -1,8 +1,11 @@
 """Advent of Code 2021 Day 12: Passage Pathing"""
 
-import networkx as nx
+from __future__ import annotations
 
 from advent_of_code import reader, tools
+from advent_of_code.lazy import lazy_import
+
+nx = lazy_import("networkx")
 
 YEAR, DAY, TEST = 2021, 12, False
 
@@ -1,15 +1,13 @@
 """Advent of Code 2021 Day 13: Transparent Origami"""
 
-import itertools as it
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Self, TypeAlias
+from typing import Self
 
+from advent_of_code import grid_utils as gru
 from advent_of_code import reader, tools
 
-CoordLike: TypeAlias = tuple[int, ...]
-
-
 YEAR, DAY, TEST = 2021, 13, False
 
 
@@ -28,38 +26,28 @@ class Fold:
 
         return cls(axis == "x", int(digit))
 
-    def do_fold(self, point: CoordLike) -> CoordLike:
-        x, y = point
-        if self.is_x and self.scale <= x:
-            return 2 * self.scale - x, y
-
-        if not self.is_x and self.scale <= y:
-            return x, 2 * self.scale - y
-
-        return x, y
+    def do_fold(self, paper: gru.PointSet) -> gru.PointSet:
+        return paper.reflect(0 if self.is_x else 1, self.scale)
 
 
 def solve():
-    input_data = reader.read_lines2(YEAR, DAY, test=TEST)
+    input_data = reader.iter_blocks2(YEAR, DAY, test=TEST)
     paper, folds = parse_input(input_data)
     one_fold(paper, folds[0])
     view_result(paper, folds)
 
 
 @tools.solution(part=0)
-def parse_input(input_data: list[str]) -> tuple[set[CoordLike], list[Fold]]:
-    points, folds = [list(g) for k, g in it.groupby(input_data, lambda x: x != "") if k]
+def parse_input(input_data: Iterable[list[str]]) -> tuple[gru.PointSet, list[Fold]]:
+    points, folds = input_data
 
     return collect_points(points), collect_folds(folds)
 
 
-def collect_points(lines: list[str]) -> set[CoordLike]:
-    paper = set()
-    for line in lines:
-        i, j = re.findall(r"\d+", line)
-        paper.add((int(i), int(j)))
-
-    return paper
+def collect_points(lines: list[str]) -> gru.PointSet:
+    return gru.PointSet(
+        (int(i), int(j)) for i, j in (re.findall(r"\d+", line) for line in lines)
+    )
 
 
 def collect_folds(lines: list[str]) -> list[Fold]:
@@ -67,43 +55,32 @@ def collect_folds(lines: list[str]) -> list[Fold]:
 
 
 @tools.solution(part=1)
-def one_fold(paper: set[CoordLike], fold: Fold) -> int:
-    return len(set(fold.do_fold(point) for point in paper))
+def one_fold(paper: gru.PointSet, fold: Fold) -> int:
+    return len(fold.do_fold(paper))
 
 
 @tools.solution(part=2)
-def view_result(paper: set[CoordLike], folds: list[Fold]) -> str:
+def view_result(paper: gru.PointSet, folds: list[Fold]) -> str:
     final_paper = many_folds(paper, folds)
 
     return display(final_paper)
 
 
-def many_folds(paper: set[CoordLike], folds: list[Fold]) -> set[CoordLike]:
+def many_folds(paper: gru.PointSet, folds: list[Fold]) -> gru.PointSet:
     current = paper
     for fold in folds:
-        current = set(fold.do_fold(point) for point in current)
+        current = fold.do_fold(current)
 
     return current
 
 
-def display(paper: set[CoordLike]) -> str:
-    grid = make_grid(paper)
-    for x, y in paper:
-        grid[y][x] = "■"
-
+def display(paper: gru.PointSet) -> str:
     text = ""
-    for line in grid:
-        text += "\n" + "".join(line)
+    for line in paper.to_grid().T:
+        text += "\n" + "".join("■" if dot else " " for dot in line)
 
     return text
 
 
-def make_grid(paper: set[CoordLike], fillval: str = " ") -> list[list[str]]:
-    x_max = max(p[0] for p in paper) + 1
-    y_max = max(p[1] for p in paper) + 1
-
-    return [[fillval for _ in range(x_max)] for __ in range(y_max)]
-
-
 if __name__ == "__main__":
     solve()
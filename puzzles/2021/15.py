@@ -1,6 +1,6 @@
 """Advent of Code 2021 Day 15: Chiton"""
 
-import itertools as it
+import numpy as np
 
 from advent_of_code import grid_utils as gru
 from advent_of_code import reader, tools
@@ -9,55 +9,45 @@ YEAR, DAY, TEST = 2021, 15, False
 
 
 def solve():
-    input_data = reader.read_lines2(YEAR, DAY, test=TEST)
+    input_data = reader.read_grid(YEAR, DAY, test=TEST, digits=True)
     navigate_cavern(input_data)
     navigate_actual_cavern(input_data)
 
 
 @tools.solution(part=1)
-def navigate_cavern(input_data: list[str]) -> int:
+def navigate_cavern(input_data: np.ndarray) -> int:
     cavern = scale_cavern(input_data, 1)
-    r, c = gru.shape(input_data)
 
-    def adj_fn(p: gru.Point):
-        return [(nbr, cavern[nbr]) for nbr in p.get_neighbors(r, c)]
-
-    target = gru.Point(r - 1, c - 1)
-    dist, _ = gru.shortest_paths(gru.origin_point(), adj_fn, target=target)
-
-    return dist[target]
+    return lowest_total_risk(cavern)
 
 
 @tools.solution(part=2)
-def navigate_actual_cavern(input_data: list[str]) -> int:
+def navigate_actual_cavern(input_data: np.ndarray) -> int:
     cavern = scale_cavern(input_data, 5)
-    r, c = gru.shape(input_data)
 
-    def adj_fn(p: gru.Point):
-        return [(nbr, cavern[nbr]) for nbr in p.get_neighbors(5 * r, 5 * c)]
+    return lowest_total_risk(cavern)
+
+
+def lowest_total_risk(cavern: gru.TiledGrid) -> int:
+    r, c = cavern.shape
+
+    def adj_fn(k: int):
+        return [(nbr, cavern[nbr]) for nbr in gru.get_packed_neighbors(k, r, c)]
 
-    target = gru.Point(5 * r - 1, 5 * c - 1)
-    dist, _ = gru.shortest_paths(gru.origin_point(), adj_fn, target=target)
+    target = gru.pack(r - 1, c - 1, c)
+    dist, _ = gru.shortest_paths(0, adj_fn, target=target, method="dial")
 
     return dist[target]
 
 
-def scale_cavern(input_data: list[str], scale: int = 1) -> dict[gru.Point, int]:
-    original_points = {p: int(val) for p, val in gru.generate_point_values(input_data)}
-    rows, cols = gru.shape(input_data)
+def scale_cavern(input_data: np.ndarray, scale: int = 1) -> gru.TiledGrid:
+    original = gru.Grid.from_numpy(input_data, typecode="b")
 
-    full_cavern = {}
-    for tile_i, tile_j in it.product(range(scale), range(scale)):
-        for p, val in original_points.items():
-            added_risk = tile_i + tile_j
-            new_val = val + added_risk
-            while new_val > 9:
-                new_val -= 9
+    return gru.TiledGrid(original, scale, add_risk)
 
-            new_point = gru.Point(p.i + (tile_i * rows), p.j + (tile_j * cols))
-            full_cavern[new_point] = new_val
 
-    return full_cavern
+def add_risk(risk: int, tile_i: int, tile_j: int) -> int:
+    return (risk + tile_i + tile_j - 1) % 9 + 1
 
 
 if __name__ == "__main__":
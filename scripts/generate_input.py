@@ -0,0 +1,22 @@
+"""generate_input.py"""
+
+import sys
+
+from loguru import logger
+
+from advent_of_code import synthetic
+
+
+def main(year: int, day: int, size: int, seed: int = 0) -> None:
+    path = synthetic.write_input(year, day, size, seed)
+    logger.info(f"Wrote {year} day {day} input (size={size}, seed={seed}): {path}")
+
+
+if __name__ == "__main__":
+    try:
+        main(*(int(arg) for arg in sys.argv[1:5]))
+    except (TypeError, ValueError) as e:
+        logger.error(
+            "Usage: python generate_input.py <year> <day> <size> [seed] "
+            f"(Not {sys.argv}: {e})"
+        )
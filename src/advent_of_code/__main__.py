@@ -0,0 +1,87 @@
+"""__main__.py
+
+Command line entry point: `python -m advent_of_code <command> ...`.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from advent_of_code import results, runner
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m advent_of_code")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Solve puzzles in parallel processes")
+    run.add_argument("--year", type=int, default=2021)
+    run.add_argument("--days", type=int, nargs="+", help="Days to run (default: all)")
+    run.add_argument("--jobs", type=int, help="Worker processes (default: CPUs)")
+    run.add_argument("--root", type=Path, default=runner.PUZZLES_DIR)
+    run.add_argument("--repeats", type=int)
+    run.add_argument("--warmup", type=int)
+    run.add_argument("--memory", action="store_true", default=None)
+    run.add_argument("--profile", choices=["cprofile", "sample"])
+    run.add_argument("--results", help="Append stage records to this JSONL/CSV file")
+    run.add_argument("--cache", action="store_true", default=None)
+    run.add_argument(
+        "--importtime",
+        action="store_true",
+        help="Report each puzzle's import time instead of solving it",
+    )
+    run.set_defaults(handler=run_puzzles)
+
+    compare = commands.add_parser(
+        "compare", help="Compare a results file against a baseline"
+    )
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed slowdown as a fraction (default: 0.1)",
+    )
+    compare.add_argument("--stat", choices=results.STATS, default="min")
+    compare.set_defaults(handler=run_compare)
+
+    args = parser.parse_args(argv)
+
+    return args.handler(args)
+
+
+def run_puzzles(args: argparse.Namespace) -> int:
+    paths = runner.discover(args.year, args.days, args.root)
+    if not paths:
+        print(f"No puzzles found for {args.year} in {args.root}")
+        return 1
+
+    if args.importtime:
+        print(runner.format_import_times(paths))
+        return 0
+
+    names = ("repeats", "warmup", "memory", "profile", "results", "cache")
+    options = {name: getattr(args, name) for name in names}
+    options = {name: value for name, value in options.items() if value is not None}
+    runs = runner.run_all(paths, args.jobs, options)
+    print(runner.format_summary(runs))
+
+    return 1 if any(run.error is not None for run in runs) else 0
+
+
+def run_compare(args: argparse.Namespace) -> int:
+    baseline = results.load_records(args.baseline)
+    current = results.load_records(args.current)
+    comparisons = results.compare(baseline, current, args.threshold, args.stat)
+    for comparison in comparisons:
+        print(results.format_comparison(comparison, args.stat))
+
+    regressions = sum(comparison.regressed for comparison in comparisons)
+    print(f"{len(comparisons)} stages compared, {regressions} regressed")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
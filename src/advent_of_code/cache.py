@@ -0,0 +1,66 @@
+"""cache.py
+
+Pickle stage results on disk, keyed by the input and the code that parsed it.
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path() / ".aoc_cache"
+
+# Returned by `load` on a miss, since `None` is a valid cached value
+MISSING = object()
+
+
+def stage_key(func: Callable, input_digest: str) -> str:
+    """Hash of the input's digest, the stage's name and its module's source.
+
+    Hashing the whole module, not just `func`, also invalidates entries when a
+    helper the stage calls is edited.
+    """
+    module = inspect.getmodule(func)
+    try:
+        source = inspect.getsource(module if module is not None else func)
+    except (OSError, TypeError):
+        source = inspect.getsource(func)
+
+    key = hashlib.blake2b(digest_size=16)
+    for part in (input_digest, func.__qualname__, source):
+        key.update(part.encode())
+        key.update(b"\0")
+
+    return key.hexdigest()
+
+
+def load(key: str, cache_dir: Path = CACHE_DIR) -> Any:
+    """The cached value for `key`, or `MISSING`."""
+    path = cache_dir / f"{key}.pickle"
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return MISSING
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        path.unlink(missing_ok=True)
+        return MISSING
+
+
+def store(key: str, value: Any, cache_dir: Path = CACHE_DIR) -> bool:
+    """Pickle `value` under `key`; returns False if it cannot be pickled."""
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"{key}.pickle"
+    partial = path.with_suffix(f".{os.getpid()}.tmp")
+    partial.write_bytes(data)
+    partial.replace(path)
+
+    return True
@@ -1,18 +1,35 @@
+from __future__ import annotations
+
 import heapq
 import itertools as it
-from collections.abc import Callable, Generator, Sequence
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from dataclasses import dataclass, field
 from functools import cache
-from typing import Any, Optional, Self, TypeAlias
+from operator import itemgetter
+from typing import Any, Literal, Optional, Self, TypeAlias
+
+from advent_of_code.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 AnyGrid: TypeAlias = Sequence[Sequence[Any]]
 AnyRaggedGrid: TypeAlias = Sequence[Sequence]
 
 ORTHOGONAL_DELTAS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
 DIAGONAL_DELTAS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+ALL_DELTAS = ORTHOGONAL_DELTAS + DIAGONAL_DELTAS
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Point:
     i: int
     j: int
@@ -40,16 +57,24 @@ class Point:
     def as_tuple(self) -> tuple[int, ...]:
         return self.i, self.j
 
+    def pack(self, cols: int) -> int:
+        return pack(self.i, self.j, cols)
+
+    @classmethod
+    def unpack(cls, index: int, cols: int) -> Self:
+        return cls(*divmod(index, cols))
+
     def manhattan(self, other: Self) -> int:
         return abs(self.i - other.i) + abs(self.j - other.j)
 
     def get_neighbors(
         self, rows: int, cols: int, diagonals: bool = False
     ) -> Generator[Self, Any, None]:
-        for delta in get_deltas() if diagonals else get_orthogonal_deltas():
-            neighbor = self + delta
-            if neighbor.is_within(rows, cols):
-                yield neighbor
+        cls, i, j = type(self), self.i, self.j
+        for di, dj in ALL_DELTAS if diagonals else ORTHOGONAL_DELTAS:
+            ni, nj = i + di, j + dj
+            if 0 <= ni < rows and 0 <= nj < cols:
+                yield cls(ni, nj)
 
     def is_boundary(self, rows: int, cols: int) -> bool:
         return self.i in (0, rows - 1) or self.j in (0, cols - 1)
@@ -94,18 +119,539 @@ def get_diagonal_deltas() -> tuple[Point, ...]:
 
 @cache
 def get_deltas() -> tuple[Point, ...]:
-    return tuple(Point(i, j) for i, j in ORTHOGONAL_DELTAS + DIAGONAL_DELTAS)
+    return tuple(Point(i, j) for i, j in ALL_DELTAS)
 
 
 def origin_point() -> Point:
     return Point(0, 0)
 
 
+# --- Packed Coordinates --- #
+
+
+def pack(i: int, j: int, cols: int) -> int:
+    """Pack `(i, j)` into the row-major flat index `i * cols + j`."""
+    return i * cols + j
+
+
+def unpack(index: int, cols: int) -> tuple[int, int]:
+    return divmod(index, cols)
+
+
+def packed_add(index: int, delta: tuple[int, int], cols: int) -> int:
+    """Offset a packed index by `delta`, without checking for row wrap-around."""
+    return index + delta[0] * cols + delta[1]
+
+
+def packed_within(index: int, delta: tuple[int, int], rows: int, cols: int) -> bool:
+    """Whether `packed_add(index, delta, cols)` stays on the grid, wrap included."""
+    i, j = divmod(index, cols)
+
+    return 0 <= i + delta[0] < rows and 0 <= j + delta[1] < cols
+
+
+def get_packed_neighbors(
+    index: int, rows: int, cols: int, diagonals: bool = False
+) -> list[int]:
+    i, j = divmod(index, cols)
+
+    return [
+        index + di * cols + dj
+        for di, dj in (ALL_DELTAS if diagonals else ORTHOGONAL_DELTAS)
+        if 0 <= i + di < rows and 0 <= j + dj < cols
+    ]
+
+
+# --- Flat Grid --- #
+
+
+def flat_index(key: int | tuple[int, int] | Point, rows: int, cols: int) -> int:
+    """Row-major index of a flat index, `(i, j)` or `Point` key, bounds-checked.
+
+    Negative flat indices count back from the last cell, as for a list.
+    """
+    if isinstance(key, int):
+        index = key + rows * cols if key < 0 else key
+        if not 0 <= index < rows * cols:
+            raise IndexError(f"{key} is outside a {(rows, cols)} grid")
+
+        return index
+
+    i, j = (key.i, key.j) if isinstance(key, Point) else key
+    if not (0 <= i < rows and 0 <= j < cols):
+        raise IndexError(f"({i}, {j}) is outside a {(rows, cols)} grid")
+
+    return i * cols + j
+
+
+class Grid:
+    """Rectangular grid stored row-major in one flat, typed `array`.
+
+    Cells are addressed by flat index, `(i, j)` or `Point`, where the flat index
+    of `(i, j)` is `i * stride + j`.
+    """
+
+    __slots__ = ("data", "rows", "cols")
+
+    def __init__(self, data: array, rows: int, cols: int) -> None:
+        if len(data) != rows * cols:
+            raise ValueError(f"Expected {rows * cols} cells, got {len(data)}")
+
+        self.data = data
+        self.rows = rows
+        self.cols = cols
+
+    @classmethod
+    def filled(cls, rows: int, cols: int, fill: int = 0, typecode: str = "l") -> Self:
+        return cls(array(typecode, [fill]) * (rows * cols), rows, cols)
+
+    @classmethod
+    def from_grid(
+        cls, grid: AnyGrid, transform: Callable[[Any], Any] = int, typecode: str = "l"
+    ) -> Self:
+        rows, cols = shape(grid)
+        data = array(typecode, (transform(val) for row in grid for val in row))
+
+        return cls(data, rows, cols)
+
+    @classmethod
+    def from_numpy(cls, cells: np.ndarray, typecode: str = "l") -> Self:
+        data = array(typecode)
+        data.frombytes(np.ascontiguousarray(cells, dtype=typecode).tobytes())
+
+        return cls(data, *cells.shape)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, self.cols
+
+    @property
+    def stride(self) -> int:
+        return self.cols
+
+    @property
+    def size(self) -> int:
+        return self.rows * self.cols
+
+    def __getitem__(self, key: int | tuple[int, int] | Point) -> Any:
+        return self.data[self.index(key)]
+
+    def __setitem__(self, key: int | tuple[int, int] | Point, value: Any) -> None:
+        self.data[self.index(key)] = value
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.data
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+
+        return self.shape == other.shape and self.data == other.data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={self.rows}, cols={self.cols})"
+
+    def index(self, key: int | tuple[int, int] | Point) -> int:
+        return flat_index(key, self.rows, self.cols)
+
+    def point(self, index: int) -> Point:
+        return Point(*divmod(index, self.cols))
+
+    def row(self, i: int) -> memoryview:
+        start = i * self.cols
+        return memoryview(self.data)[start : start + self.cols]
+
+    def col(self, j: int) -> memoryview:
+        return memoryview(self.data)[j :: self.cols]
+
+    def copy(self) -> Self:
+        return type(self)(array(self.data.typecode, self.data), self.rows, self.cols)
+
+    def items(self) -> Generator[tuple[Point, Any], Any, None]:
+        return ((self.point(k), val) for k, val in enumerate(self.data))
+
+    def to_lists(self) -> list[list[Any]]:
+        return [self.row(i).tolist() for i in range(self.rows)]
+
+    def to_numpy(self) -> np.ndarray:
+        """Zero-copy `(rows, cols)` NumPy view of the cells."""
+        return np.frombuffer(self.data, dtype=self.data.typecode).reshape(self.shape)
+
+
+class TiledGrid:
+    """Read-only `base` repeated `scale` times each way, computed cell by cell.
+
+    `transform(value, tile_i, tile_j)` gives the value of a base cell when it
+    appears in tile `(tile_i, tile_j)`. Lookups match `Grid`.
+    """
+
+    __slots__ = ("base", "scale", "transform", "rows", "cols")
+
+    def __init__(
+        self,
+        base: Grid,
+        scale: int,
+        transform: Callable[[Any, int, int], Any] = lambda val, ti, tj: val,
+    ) -> None:
+        self.base = base
+        self.scale = scale
+        self.transform = transform
+        self.rows = base.rows * scale
+        self.cols = base.cols * scale
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, self.cols
+
+    @property
+    def size(self) -> int:
+        return self.rows * self.cols
+
+    def __getitem__(self, key: int | tuple[int, int] | Point) -> Any:
+        i, j = divmod(flat_index(key, self.rows, self.cols), self.cols)
+        base = self.base
+        tile_i, bi = divmod(i, base.rows)
+        tile_j, bj = divmod(j, base.cols)
+
+        return self.transform(base.data[bi * base.cols + bj], tile_i, tile_j)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(base={self.base!r}, scale={self.scale})"
+
+    def materialize(self) -> Grid:
+        data = array(self.base.data.typecode, map(self.__getitem__, range(self.size)))
+
+        return Grid(data, self.rows, self.cols)
+
+
+class GridIndex:
+    """Value-to-positions index of a grid, built in one pass.
+
+    Positions are packed indices. Per-row and per-column counts are kept for
+    each value, and all of it is updated in place when a cell is assigned.
+    """
+
+    __slots__ = ("cells", "rows", "cols", "positions", "row_counts", "col_counts")
+
+    def __init__(self, grid: AnyGrid | Grid) -> None:
+        self.rows, self.cols = shape(grid)
+        self.cells = list(grid.data if isinstance(grid, Grid) else it.chain(*grid))
+        self.positions: defaultdict[Any, set[int]] = defaultdict(set)
+        self.row_counts: defaultdict[Any, Counter[int]] = defaultdict(Counter)
+        self.col_counts: defaultdict[Any, Counter[int]] = defaultdict(Counter)
+        for k, val in enumerate(self.cells):
+            self._add(k, val)
+
+    def __getitem__(self, key: int | tuple[int, int] | Point) -> Any:
+        return self.cells[self.index(key)]
+
+    def __setitem__(self, key: int | tuple[int, int] | Point, value: Any) -> None:
+        k = self.index(key)
+        self._remove(k, self.cells[k])
+        self.cells[k] = value
+        self._add(k, value)
+
+    def __contains__(self, value: Any) -> bool:
+        return bool(self.positions.get(value))
+
+    def index(self, key: int | tuple[int, int] | Point) -> int:
+        return flat_index(key, self.rows, self.cols)
+
+    def count(self, value: Any) -> int:
+        return len(self.positions.get(value, ()))
+
+    def count_in_row(self, value: Any, i: int) -> int:
+        return self.row_counts[value][i] if value in self.row_counts else 0
+
+    def count_in_col(self, value: Any, j: int) -> int:
+        return self.col_counts[value][j] if value in self.col_counts else 0
+
+    def search(self, value: Any, packed: bool = False) -> Iterator[Point | int]:
+        """Row-major positions of `value`, in O(matches)."""
+        found = sorted(self.positions.get(value, ()))
+        if packed:
+            return iter(found)
+
+        return (Point(*divmod(k, self.cols)) for k in found)
+
+    def find_one(self, value: Any, packed: bool = False) -> Point | int:
+        found = self.positions.get(value)
+        if not found:
+            raise ValueError(f"{value!r} is not in the grid")
+
+        k = min(found)
+        return k if packed else Point(*divmod(k, self.cols))
+
+    def _add(self, k: int, value: Any) -> None:
+        i, j = divmod(k, self.cols)
+        self.positions[value].add(k)
+        self.row_counts[value][i] += 1
+        self.col_counts[value][j] += 1
+
+    def _remove(self, k: int, value: Any) -> None:
+        i, j = divmod(k, self.cols)
+        self.positions[value].discard(k)
+        self.row_counts[value][i] -= 1
+        self.col_counts[value][j] -= 1
+        if not self.positions[value]:
+            del self.positions[value], self.row_counts[value], self.col_counts[value]
+
+
+# --- Point Sets --- #
+
+
+class PointSet:
+    """Set of integer `(a, b)` coordinates held as a deduplicated `(n, 2)` array.
+
+    Transforms work on all points at once and return a new, deduplicated set.
+    """
+
+    __slots__ = ("coords",)
+
+    def __init__(self, coords: np.ndarray | Iterable[tuple[int, int]]) -> None:
+        arr = np.asarray(coords if isinstance(coords, np.ndarray) else list(coords))
+        self.coords = _unique_coords(arr.astype(np.int64).reshape(-1, 2))
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return map(tuple, self.coords.tolist())
+
+    def __contains__(self, point: tuple[int, int]) -> bool:
+        return bool(np.any(np.all(self.coords == point, axis=1)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointSet):
+            return NotImplemented
+
+        return np.array_equal(self.coords, other.coords)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n={len(self)})"
+
+    def reflect(self, axis: int, line: int) -> Self:
+        """Mirror every coordinate beyond `line` on `axis` back across it."""
+        coords = self.coords.copy()
+        values = coords[:, axis]
+        np.copyto(values, 2 * line - values, where=values > line)
+
+        return type(self)(coords)
+
+    def translate(self, delta: tuple[int, int]) -> Self:
+        return type(self)(self.coords + np.asarray(delta, dtype=np.int64))
+
+    def to_grid(self) -> np.ndarray:
+        """Dense boolean grid indexed by `(a, b)`, for non-negative coordinates."""
+        if not len(self):
+            return np.zeros((0, 0), dtype=bool)
+
+        grid = np.zeros(tuple(self.coords.max(axis=0) + 1), dtype=bool)
+        grid[self.coords[:, 0], self.coords[:, 1]] = True
+
+        return grid
+
+
+def _unique_coords(coords: np.ndarray) -> np.ndarray:
+    if not len(coords):
+        return coords
+
+    low = coords.min(axis=0)
+    span = int(coords[:, 1].max() - low[1]) + 1
+    keys = np.unique((coords[:, 0] - low[0]) * span + (coords[:, 1] - low[1]))
+
+    return np.column_stack((keys // span + low[0], keys % span + low[1]))
+
+
+# --- Grid Views --- #
+
+
+class LineView(Sequence):
+    """Lazy line of cells `grid[i0 + k * di][j0 + k * dj]` for `0 <= k < length`."""
+
+    __slots__ = ("grid", "i0", "j0", "di", "dj", "length")
+
+    def __init__(
+        self, grid: AnyGrid, i0: int, j0: int, di: int, dj: int, length: int
+    ) -> None:
+        self.grid = grid
+        self.i0, self.j0 = i0, j0
+        self.di, self.dj = di, dj
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, k: int) -> Any:
+        if k < 0:
+            k += self.length
+        if not 0 <= k < self.length:
+            raise IndexError(k)
+
+        return self.grid[self.i0 + k * self.di][self.j0 + k * self.dj]
+
+    def __iter__(self) -> Iterator[Any]:
+        grid, i, j, n = self.grid, self.i0, self.j0, self.length
+        # Axis-aligned lines iterate in C rather than indexing twice per cell
+        if self.di == 0 and self.dj == 1:
+            return it.islice(grid[i], j, j + n)
+        if self.dj == 0 and self.di == 1:
+            return map(itemgetter(j), it.islice(grid, i, i + n))
+        if self.dj == 0 and self.di == -1:
+            start = len(grid) - 1 - i
+            return map(itemgetter(j), it.islice(reversed(grid), start, start + n))
+
+        return self._walk()
+
+    def _walk(self) -> Iterator[Any]:
+        grid, i, j = self.grid, self.i0, self.j0
+        for _ in range(self.length):
+            yield grid[i][j]
+            i += self.di
+            j += self.dj
+
+    def materialize(self) -> list[Any]:
+        return list(self)
+
+
+class LinesView(Sequence):
+    """Lazy sequence of `LineView`s, built on access by `make_line(k)`."""
+
+    __slots__ = ("length", "make_line")
+
+    def __init__(self, length: int, make_line: Callable[[int], LineView]) -> None:
+        self.length = length
+        self.make_line = make_line
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, k: int) -> LineView:
+        if k < 0:
+            k += self.length
+        if not 0 <= k < self.length:
+            raise IndexError(k)
+
+        return self.make_line(k)
+
+    def __iter__(self) -> Iterator[LineView]:
+        return map(self.make_line, range(self.length))
+
+    def materialize(self) -> list[list[Any]]:
+        return [line.materialize() for line in self]
+
+
+def transpose_view(grid: AnyGrid) -> LinesView:
+    """Lazy `transpose` of a rectangular grid."""
+    r, c = shape(grid)
+
+    return LinesView(c, lambda k: LineView(grid, 0, k, 1, 0, r))
+
+
+def rotate_view(grid: AnyGrid) -> LinesView:
+    """Lazy `rotate` (90 degrees clockwise) of a rectangular grid."""
+    r, c = shape(grid)
+
+    return LinesView(c, lambda k: LineView(grid, r - 1, k, -1, 0, r))
+
+
+def rotate_diagonal_view(grid: AnyGrid) -> LinesView:
+    """Lazy `rotate_diagonal` of a square grid."""
+    n = len(grid)
+
+    def make_line(k: int) -> LineView:
+        i0 = max(0, k - n + 1)
+        return LineView(grid, i0, k - i0, 1, -1, min(k, n - 1) - i0 + 1)
+
+    return LinesView(2 * n - 1, make_line)
+
+
+# --- Cellular Automata --- #
+
+
+def shifted_slices(
+    rows: int, cols: int, di: int, dj: int
+) -> tuple[tuple[slice, slice], tuple[slice, slice]]:
+    """Slices pairing every in-bounds cell `(i, j)` with its neighbor `(i+di, j+dj)`."""
+    here = (
+        slice(max(0, -di), rows - max(0, di)),
+        slice(max(0, -dj), cols - max(0, dj)),
+    )
+    there = (
+        slice(max(0, di), rows - max(0, -di)),
+        slice(max(0, dj), cols - max(0, -dj)),
+    )
+
+    return here, there
+
+
+def neighbor_sum(cells: np.ndarray, diagonals: bool = True) -> np.ndarray:
+    """Sum of each cell's in-bounds neighbors, without wrap-around."""
+    r, c = cells.shape
+    total = np.zeros((r, c), dtype=np.int64)
+    for di, dj in ALL_DELTAS if diagonals else ORTHOGONAL_DELTAS:
+        here, there = shifted_slices(r, c, di, dj)
+        total[here] += cells[there]
+
+    return total
+
+
+class ThresholdAutomaton:
+    """Dense cascading-threshold automaton, such as day 11's flash rule.
+
+    Each step adds one to every cell. A cell reaching `threshold` fires once,
+    adding one to each neighbor, which may cascade; fired cells then drop back
+    to `reset`.
+    """
+
+    __slots__ = ("state", "threshold", "diagonals", "reset", "steps")
+
+    def __init__(
+        self,
+        state: np.ndarray,
+        threshold: int,
+        diagonals: bool = True,
+        reset: int = 0,
+    ) -> None:
+        self.state = np.array(state, dtype=np.int64)
+        self.threshold = threshold
+        self.diagonals = diagonals
+        self.reset = reset
+        self.steps = 0
+
+    def step(self) -> int:
+        """Advance one step and return how many cells fired."""
+        state = self.state
+        state += 1
+        fired = np.zeros(state.shape, dtype=bool)
+        firing = state >= self.threshold
+        while firing.any():
+            fired |= firing
+            state += neighbor_sum(firing, self.diagonals)
+            firing = (state >= self.threshold) & ~fired
+
+        state[fired] = self.reset
+        self.steps += 1
+
+        return int(np.count_nonzero(fired))
+
+    def run(self, steps: int) -> list[int]:
+        return [self.step() for _ in range(steps)]
+
+    def run_until(self, predicate: Callable[[int], bool], max_steps: int) -> int:
+        """First step number whose fired count satisfies `predicate`, else -1."""
+        for _ in range(max_steps):
+            if predicate(self.step()):
+                return self.steps
+
+        return -1
+
+
 # --- Grid Utilities --- #
 
 
-def find_one(grid: AnyGrid, target: Any) -> Point:
-    return next(search(grid, target))
+def find_one(grid: AnyGrid, target: Any, packed: bool = False) -> Point | int:
+    return next(search(grid, target, packed))
 
 
 def is_square(grid: AnyGrid) -> bool:
@@ -120,8 +666,82 @@ def generate_edges(grid: AnyGrid, diagonals: bool = False):
                 yield u, v
 
 
-def generate_points(grid: AnyGrid) -> Generator[Point, Any, None]:
+def generate_csr(
+    grid: AnyGrid | Grid,
+    diagonals: bool = False,
+    mask: Optional[Callable[[Any], bool]] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Neighbor structure as CSR `(indptr, indices)` arrays over packed cell ids.
+
+    The neighbors of cell `k` are `indices[indptr[k] : indptr[k + 1]]`, in the same
+    order as `Point.get_neighbors`. Cells failing `mask` get no edges either way.
+    """
     r, c = shape(grid)
+    ids = np.arange(r * c).reshape(r, c)
+    keep = None
+    if mask is not None:
+        cells = grid.data if isinstance(grid, Grid) else it.chain.from_iterable(grid)
+        keep = np.fromiter(map(mask, cells), dtype=bool, count=r * c).reshape(r, c)
+
+    sources, targets = [], []
+    for di, dj in ALL_DELTAS if diagonals else ORTHOGONAL_DELTAS:
+        src, dst = shifted_slices(r, c, di, dj)
+        if keep is None:
+            sources.append(ids[src].ravel())
+            targets.append(ids[dst].ravel())
+            continue
+
+        valid = keep[src] & keep[dst]
+        sources.append(ids[src][valid])
+        targets.append(ids[dst][valid])
+
+    sources_arr, targets_arr = np.concatenate(sources), np.concatenate(targets)
+    indices = targets_arr[np.argsort(sources_arr, kind="stable")]
+    indptr = np.zeros(r * c + 1, dtype=indices.dtype)
+    np.cumsum(np.bincount(sources_arr, minlength=r * c), out=indptr[1:])
+
+    return indptr, indices
+
+
+def label_components(
+    grid: AnyGrid | Grid,
+    predicate: Callable[[Any], bool],
+    diagonals: bool = False,
+) -> tuple[array, list[int]]:
+    """Flood-fill connected regions of cells satisfying `predicate`.
+
+    Returns a flat, row-major label per cell (`-1` where `predicate` fails) and
+    the size of each component, indexed by label.
+    """
+    r, c = shape(grid)
+    cells = grid.data if isinstance(grid, Grid) else it.chain.from_iterable(grid)
+    included = bytearray(map(predicate, cells))
+    labels = array("l", [-1]) * (r * c)
+    sizes: list[int] = []
+    for seed, include in enumerate(included):
+        if not include or labels[seed] != -1:
+            continue
+
+        label, size = len(sizes), 0
+        labels[seed] = label
+        stack = [seed]
+        while stack:
+            k = stack.pop()
+            size += 1
+            for nbr in get_packed_neighbors(k, r, c, diagonals):
+                if included[nbr] and labels[nbr] == -1:
+                    labels[nbr] = label
+                    stack.append(nbr)
+
+        sizes.append(size)
+
+    return labels, sizes
+
+
+def generate_points(grid: AnyGrid, packed: bool = False) -> Iterator[Point | int]:
+    r, c = shape(grid)
+    if packed:
+        return iter(range(r * c))
 
     return (Point(i, j) for i, j in it.product(range(r), range(c)))
 
@@ -138,11 +758,13 @@ def parse_to_dict(grid: AnyGrid, transform=lambda x: x) -> dict[Point, Any]:
     return {point: transform(val) for point, val in generate_point_values(grid)}
 
 
-def search(grid: AnyGrid, target: Any) -> Generator[Point, None, None]:
+def search(
+    grid: AnyGrid, target: Any, packed: bool = False
+) -> Generator[Point | int, None, None]:
     for i, row in enumerate(grid):
         for j, val in enumerate(row):
             if val == target:
-                yield Point(i, j)
+                yield i * len(row) + j if packed else Point(i, j)
 
 
 def rotate(grid: AnyGrid) -> AnyGrid:
@@ -160,7 +782,10 @@ def rotate_diagonal(grid: AnyGrid) -> AnyRaggedGrid:
     return rotated
 
 
-def shape(grid: AnyGrid) -> tuple[int, int]:
+def shape(grid: AnyGrid | Grid | TiledGrid) -> tuple[int, int]:
+    if isinstance(grid, (Grid, TiledGrid)):
+        return grid.shape
+
     return len(grid), len(grid[0])
 
 
@@ -177,6 +802,71 @@ def shortest_paths[T](
     start: T,
     get_neighbors: Callable[[T], list[tuple[T, int]]],
     target: Optional[T] = None,
+    method: Literal["dijkstra", "dial", "astar", "bidirectional"] = "dijkstra",
+    heuristic: Optional[Callable[[T], int]] = None,
+    reverse_neighbors: Optional[Callable[[T], list[tuple[T, int]]]] = None,
+) -> tuple[dict[T, int], dict[T, T]]:
+    """Single-source shortest paths, stopping early once `target` is settled.
+
+    `"dial"` uses a bucket queue and needs non-negative integer costs. `"astar"`
+    orders the frontier by distance plus `heuristic`, which must be consistent
+    (e.g. `Point.manhattan` to the target) and requires a `target`.
+    `"bidirectional"` also searches back from `target` along `reverse_neighbors`,
+    which must give each edge `u -> v` as `(u, cost)` from `v`; on grids where
+    entering a cell costs its value that is not `get_neighbors` (see
+    `packed_entry_costs`). Its `predecessors` always hold the full
+    start-to-target path.
+    """
+    if method == "dijkstra":
+        return _dijkstra(start, get_neighbors, target)
+
+    if method == "dial":
+        return _dial(start, get_neighbors, target)
+
+    if method == "astar":
+        if target is None or heuristic is None:
+            raise ValueError("A* search needs both a target and a heuristic")
+
+        return _astar(start, get_neighbors, target, heuristic)
+
+    if method == "bidirectional":
+        if target is None or reverse_neighbors is None:
+            raise ValueError(
+                "Bidirectional search needs a target and reverse_neighbors"
+            )
+
+        return _bidirectional(start, get_neighbors, target, reverse_neighbors)
+
+    raise ValueError(f"Unknown shortest path method: {method=}")
+
+
+def packed_entry_costs(
+    grid: Grid | TiledGrid, diagonals: bool = False
+) -> tuple[
+    Callable[[int], list[tuple[int, int]]], Callable[[int], list[tuple[int, int]]]
+]:
+    """Forward and reverse adjacency over packed cells, entering a cell costs its value.
+
+    Moving `u -> v` costs `grid[v]`, so searching back from `v` reaches each
+    neighbor `u` for `grid[v]`. Pass the pair as `get_neighbors` and
+    `reverse_neighbors` to `shortest_paths`.
+    """
+    r, c = shape(grid)
+
+    def forward(k: int) -> list[tuple[int, int]]:
+        return [(nbr, grid[nbr]) for nbr in get_packed_neighbors(k, r, c, diagonals)]
+
+    def reverse(k: int) -> list[tuple[int, int]]:
+        cost = grid[k]
+        return [(nbr, cost) for nbr in get_packed_neighbors(k, r, c, diagonals)]
+
+    return forward, reverse
+
+
+def _dijkstra[T](
+    start: T,
+    get_neighbors: Callable[[T], list[tuple[T, int]]],
+    target: Optional[T] = None,
 ) -> tuple[dict[T, int], dict[T, T]]:
     distances: dict[T, int] = {start: 0}
     predecessors: dict[T, T] = {}
@@ -199,3 +889,229 @@ def shortest_paths[T](
                 heapq.heappush(pq, (new_risk, neighbor))
 
     return distances, predecessors
+
+
+def _dial[T](
+    start: T,
+    get_neighbors: Callable[[T], list[tuple[T, int]]],
+    target: Optional[T] = None,
+) -> tuple[dict[T, int], dict[T, T]]:
+    distances: dict[T, int] = {start: 0}
+    predecessors: dict[T, T] = {}
+    buckets: dict[int, list[T]] = {0: [start]}
+    while buckets:
+        current_risk = min(buckets)
+        for current_node in buckets.pop(current_risk):
+            if current_risk > distances[current_node]:
+                continue
+
+            if target is not None and current_node == target:
+                return distances, predecessors
+
+            for neighbor, cost in get_neighbors(current_node):
+                new_risk = current_risk + cost
+                old_risk = distances.get(neighbor)
+
+                if old_risk is None or new_risk < old_risk:
+                    distances[neighbor] = new_risk
+                    predecessors[neighbor] = current_node
+                    buckets.setdefault(new_risk, []).append(neighbor)
+
+    return distances, predecessors
+
+
+def _astar[T](
+    start: T,
+    get_neighbors: Callable[[T], list[tuple[T, int]]],
+    target: T,
+    heuristic: Callable[[T], int],
+) -> tuple[dict[T, int], dict[T, T]]:
+    distances: dict[T, int] = {start: 0}
+    predecessors: dict[T, T] = {}
+    pq = [(heuristic(start), 0, start)]
+    while pq:
+        _, current_risk, current_node = heapq.heappop(pq)
+
+        if current_risk > distances[current_node]:
+            continue
+
+        if current_node == target:
+            break
+
+        for neighbor, cost in get_neighbors(current_node):
+            new_risk = current_risk + cost
+            old_risk = distances.get(neighbor)
+
+            if old_risk is None or new_risk < old_risk:
+                distances[neighbor] = new_risk
+                predecessors[neighbor] = current_node
+                estimate = new_risk + heuristic(neighbor)
+                heapq.heappush(pq, (estimate, new_risk, neighbor))
+
+    return distances, predecessors
+
+
+def _bidirectional[T](
+    start: T,
+    get_neighbors: Callable[[T], list[tuple[T, int]]],
+    target: T,
+    reverse_neighbors: Callable[[T], list[tuple[T, int]]],
+) -> tuple[dict[T, int], dict[T, T]]:
+    if start == target:
+        return {start: 0}, {}
+
+    adjacency = (get_neighbors, reverse_neighbors)
+    distances: tuple[dict[T, int], dict[T, int]] = ({start: 0}, {target: 0})
+    predecessors: tuple[dict[T, T], dict[T, T]] = ({}, {})
+    pqs = ([(0, start)], [(0, target)])
+    best, meeting = float("inf"), None
+    while pqs[0] and pqs[1] and pqs[0][0][0] + pqs[1][0][0] < best:
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        dist, other_dist = distances[side], distances[1 - side]
+        current_risk, current_node = heapq.heappop(pqs[side])
+
+        if current_risk > dist[current_node]:
+            continue
+
+        for neighbor, cost in adjacency[side](current_node):
+            new_risk = current_risk + cost
+
+            if new_risk < dist.get(neighbor, float("inf")):
+                dist[neighbor] = new_risk
+                predecessors[side][neighbor] = current_node
+                heapq.heappush(pqs[side], (new_risk, neighbor))
+
+            if neighbor in other_dist and dist[neighbor] + other_dist[neighbor] < best:
+                best, meeting = dist[neighbor] + other_dist[neighbor], neighbor
+
+    forward_dist, forward_pred = distances[0], predecessors[0]
+    if meeting is None:
+        return forward_dist, forward_pred
+
+    node = meeting
+    while node != target:
+        successor = predecessors[1][node]
+        forward_pred[successor] = node
+        forward_dist[successor] = best - distances[1][successor]
+        node = successor
+
+    return forward_dist, forward_pred
+
+
+class ArrayPointMap(Mapping):
+    """Read-only `Point -> value` mapping over a flat, row-major result array.
+
+    Cells where `valid` is false (e.g. unreachable) are treated as missing keys.
+    Packed indices are accepted as keys too.
+    """
+
+    __slots__ = ("values", "valid", "cols", "convert", "_len")
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        valid: np.ndarray,
+        cols: int,
+        convert: Callable[[Any], Any] = int,
+    ) -> None:
+        self.values = values
+        self.valid = valid
+        self.cols = cols
+        self.convert = convert
+        self._len = int(np.count_nonzero(valid))
+
+    def __getitem__(self, key: Point | int) -> Any:
+        if isinstance(key, int):
+            k = key
+        elif 0 <= key.i and 0 <= key.j < self.cols:
+            k = key.i * self.cols + key.j
+        else:
+            raise KeyError(key)
+
+        if not (0 <= k < len(self.values) and self.valid[k]):
+            raise KeyError(key)
+
+        return self.convert(self.values[k])
+
+    def __iter__(self) -> Iterator[Point]:
+        for k in np.flatnonzero(self.valid).tolist():
+            yield Point(*divmod(k, self.cols))
+
+    def __len__(self) -> int:
+        return self._len
+
+
+def csgraph_shortest_paths(
+    grid: AnyGrid | Grid,
+    start: Point,
+    diagonals: bool = False,
+    transform: Callable[[Any], int] = int,
+) -> tuple[ArrayPointMap, ArrayPointMap]:
+    """Compiled Dijkstra from `start` via `scipy.sparse.csgraph`.
+
+    Entering a cell costs its value, as with day 15's cavern. Returns the same
+    `(distances, predecessors)` pair as `shortest_paths`, keyed by `Point`.
+    """
+    from scipy.sparse import csr_array
+    from scipy.sparse.csgraph import dijkstra
+
+    r, c = shape(grid)
+    if isinstance(grid, Grid):
+        costs = grid.to_numpy().ravel()
+    else:
+        costs = np.fromiter(
+            (transform(val) for val in it.chain.from_iterable(grid)),
+            dtype=np.int64,
+            count=r * c,
+        )
+
+    indptr, indices = generate_csr(grid, diagonals)
+    graph = csr_array((costs[indices], indices, indptr), shape=(r * c, r * c))
+    dist, pred = dijkstra(graph, indices=start.pack(c), return_predecessors=True)
+
+    def to_point(k: Any) -> Point:
+        return Point(*divmod(int(k), c))
+
+    distances = ArrayPointMap(dist, np.isfinite(dist), c)
+    predecessors = ArrayPointMap(pred, pred >= 0, c, to_point)
+
+    return distances, predecessors
+
+
+def multi_source_paths[T](
+    starts: Iterable[T],
+    get_neighbors: Callable[[T], list[tuple[T, int]]],
+) -> tuple[dict[T, int], dict[T, T]]:
+    """Distance from every reachable node to its nearest start, and that start."""
+    distances: dict[T, int] = {}
+    sources: dict[T, T] = {}
+    for start in starts:
+        distances[start] = 0
+        sources[start] = start
+
+    pq = [(0, start) for start in distances]
+    heapq.heapify(pq)
+    while pq:
+        current_risk, current_node = heapq.heappop(pq)
+
+        if current_risk > distances[current_node]:
+            continue
+
+        for neighbor, cost in get_neighbors(current_node):
+            new_risk = current_risk + cost
+
+            if new_risk < distances.get(neighbor, float("inf")):
+                distances[neighbor] = new_risk
+                sources[neighbor] = sources[current_node]
+                heapq.heappush(pq, (new_risk, neighbor))
+
+    return distances, sources
+
+
+def reconstruct_path[T](predecessors: dict[T, T], target: T) -> list[T]:
+    """Walk `predecessors` back from `target`, returning the path start-first."""
+    path = [target]
+    while path[-1] in predecessors:
+        path.append(predecessors[path[-1]])
+
+    return path[::-1]
@@ -0,0 +1,31 @@
+"""lazy.py
+
+Defer importing heavy modules until one of their attributes is first used.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return `name` as a module that only executes on first attribute access.
+
+    Already imported modules are returned as they are. Annotations that name the
+    module's types need `from __future__ import annotations`, or they would
+    trigger the import at definition time.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
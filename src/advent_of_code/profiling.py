@@ -0,0 +1,92 @@
+"""profiling.py
+
+Run a single call under `cProfile` or a stack sampler and write the results.
+"""
+
+import cProfile
+import sys
+import threading
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType
+from typing import Any, Literal, Self
+
+ProfileMode = Literal["cprofile", "sample"]
+
+# Seconds between stack samples; the GIL switch interval bounds the real rate
+SAMPLE_INTERVAL = 0.001
+
+
+def profile_call(
+    func: Callable, args: tuple, kwargs: dict, mode: ProfileMode, path: Path
+) -> Path:
+    """Call `func` once under the given profiler, writing to `path` + suffix.
+
+    `"cprofile"` writes a `.pstats` file for `pstats`/snakeviz; `"sample"` writes
+    a `.collapsed` file of folded stacks, ready for `flamegraph.pl` or speedscope.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.runcall(func, *args, **kwargs)
+        out = path.with_suffix(".pstats")
+        profiler.dump_stats(out)
+        return out
+
+    if mode == "sample":
+        with StackSampler() as sampler:
+            func(*args, **kwargs)
+        out = path.with_suffix(".collapsed")
+        sampler.write_collapsed(out)
+        return out
+
+    raise ValueError(f"Unknown profile mode: {mode=}")
+
+
+class StackSampler:
+    """Sample the calling thread's stack from a background thread.
+
+    Only frames below the `with` block are kept, so every stack starts at the
+    profiled call.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._target = 0
+        self._root: FrameType | None = None
+
+    def __enter__(self) -> Self:
+        self._target = threading.get_ident()
+        self._root = sys._getframe(1)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None and frame is not self._root:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        with path.open("w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
@@ -1,11 +1,110 @@
 """reader.py"""
 
+from __future__ import annotations
+
+import hashlib
+import itertools as it
+import mmap
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import cache, cached_property
 from pathlib import Path
 
+from advent_of_code.lazy import lazy_import
+
+np = lazy_import("numpy")
+
 DATA_DIR = Path() / "data"
 INPUT_DIR = Path() / "inputs"
 SAMPLE_DIR = Path() / "samples"
 
+STREAM_BUFFER_SIZE = 1 << 16
+MAX_INT_DIGITS = 18
+
+_CACHE: dict[Path, "InputFile"] = {}
+_LAST_INPUT: dict[tuple[int, int], Path] = {}
+
+
+@dataclass(frozen=True)
+class InputFile:
+    """A memory-mapped input file, with decoded text and line index built lazily."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    digest: str
+    buffer: mmap.mmap | bytes = field(repr=False, compare=False)
+
+    @property
+    def data(self) -> memoryview:
+        return memoryview(self.buffer)
+
+    @cached_property
+    def text(self) -> str:
+        """The decoded file, with CRLF and CR line endings read as newlines."""
+        text = str(self.buffer[:], "utf-8")
+
+        return text.replace("\r\n", "\n").replace("\r", "\n") if "\r" in text else text
+
+    @cached_property
+    def lines(self) -> tuple[str, ...]:
+        return tuple(self.text.splitlines())
+
+    @cached_property
+    def line_offsets(self) -> np.ndarray:
+        """Start offset of each line, plus one past the final line's newline."""
+        newlines = np.flatnonzero(np.frombuffer(self.buffer, dtype=np.uint8) == 10)
+        ends = newlines + 1
+        if self.size and (not len(newlines) or newlines[-1] != self.size - 1):
+            ends = np.append(ends, self.size + 1)
+
+        return np.concatenate(([0], ends))
+
+    @property
+    def num_lines(self) -> int:
+        return len(self.line_offsets) - 1
+
+    def is_current(self, size: int, mtime_ns: int) -> bool:
+        return self.size == size and self.mtime_ns == mtime_ns
+
+    def line(self, k: int) -> memoryview:
+        """Line `k` as a zero-copy view of the buffer, without its line ending."""
+        start, stop = self.line_offsets[k], self.line_offsets[k + 1] - 1
+        stop = min(stop, self.size)
+        if stop > start and self.buffer[stop - 1] == ord("\r"):
+            stop -= 1
+
+        return self.data[start:stop]
+
+
+def load(path: Path) -> InputFile:
+    """Memory-map `path`, reusing the cached mapping while its size and mtime hold.
+
+    Views over the mapping, such as `parse_grid`'s, read the file itself. Replace
+    an input with a new file (`os.replace`) rather than rewriting it: truncating
+    a mapped file kills the process with SIGBUS on the next read of a view.
+    """
+    key = Path(path).resolve()
+    stat = key.stat()
+    cached = _CACHE.get(key)
+    if cached is not None and cached.is_current(stat.st_size, stat.st_mtime_ns):
+        return cached
+
+    buffer = _map_file(key, stat.st_size)
+    digest = hashlib.blake2b(buffer, digest_size=16).hexdigest()
+    loaded = InputFile(key, stat.st_size, stat.st_mtime_ns, digest, buffer)
+    _CACHE[key] = loaded
+
+    return loaded
+
+
+def _map_file(path: Path, size: int) -> mmap.mmap | bytes:
+    if size == 0:
+        return b""
+
+    with path.open("rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
 
 def read_lines(year: int, day: int, test: bool = False) -> list[str]:
     line = read(year, day, test)
@@ -24,10 +123,146 @@ def read(year: int, day: int, test: bool = False) -> str:
 def read_lines2(
     year: int, day: int, test: bool = False, test_num: int = 1
 ) -> list[str]:
-    return read2(year, day, test=test, test_num=test_num).splitlines()
+    return list(load_input(year, day, test=test, test_num=test_num).lines)
 
 
 def read2(year: int, day: int, test: bool = False, test_num: int = 1) -> str:
+    """The input's text, with line endings normalised as by `Path.read_text`."""
+    return load_input(year, day, test=test, test_num=test_num).text
+
+
+def iter_lines2(
+    year: int, day: int, test: bool = False, test_num: int = 1
+) -> Iterator[str]:
+    """Stream the input's lines, without newlines, through a bounded buffer.
+
+    The path is resolved on call, so the input is known before streaming starts.
+    """
+    return _stream_lines(input_path(year, day, test=test, test_num=test_num))
+
+
+def iter_blocks2(
+    year: int, day: int, test: bool = False, test_num: int = 1
+) -> Iterator[list[str]]:
+    """Stream the input as lists of lines, split on blank lines."""
+    return _split_blocks(iter_lines2(year, day, test=test, test_num=test_num))
+
+
+def _stream_lines(path: Path) -> Iterator[str]:
+    with path.open(buffering=STREAM_BUFFER_SIZE) as f:
+        for line in f:
+            yield line[:-1] if line.endswith("\n") else line
+
+
+def _split_blocks(lines: Iterator[str]) -> Iterator[list[str]]:
+    for k, block in it.groupby(lines, lambda x: x != ""):
+        if k:
+            yield list(block)
+
+
+def read_ints(
+    year: int,
+    day: int,
+    test: bool = False,
+    test_num: int = 1,
+    cols: int | None = None,
+) -> np.ndarray:
+    """Every signed integer in the input, optionally as one row of `cols` per line.
+
+    With `cols`, lines without integers are skipped and any other line holding a
+    different count raises, rather than shifting every later row.
+    """
+    loaded = load_input(year, day, test=test, test_num=test_num)
+    if cols is None:
+        return parse_ints(loaded.buffer)
+
+    values, starts = _parse_ints(loaded.buffer)
+    lines = np.searchsorted(loaded.line_offsets, starts, side="right") - 1
+    counts = np.bincount(lines, minlength=loaded.num_lines)
+    wrong = np.flatnonzero((counts != 0) & (counts != cols))
+    if len(wrong):
+        k = int(wrong[0])
+        raise ValueError(f"Line {k + 1} has {counts[k]} integers, expected {cols}")
+
+    return values.reshape(-1, cols)
+
+
+def read_grid(
+    year: int,
+    day: int,
+    test: bool = False,
+    test_num: int = 1,
+    digits: bool = False,
+) -> np.ndarray:
+    """The input as a 2D byte array, or its digit values when `digits` is set."""
+    loaded = load_input(year, day, test=test, test_num=test_num)
+
+    return parse_grid(loaded.buffer, digits)
+
+
+def parse_grid(buffer: bytes | mmap.mmap, digits: bool = False) -> np.ndarray:
+    """Read-only `(rows, cols)` view over equal-width, newline-separated rows.
+
+    The view strides over the raw buffer, skipping each newline, so nothing is
+    copied unless `digits` asks for the bulk `- ord("0")` decode. Over a memory
+    map the view is only valid while the file keeps its contents; see `load`.
+    """
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    if not len(raw):
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    newline = buffer.find(b"\n")
+    stride = len(raw) + 1 if newline == -1 else newline + 1
+    cols = stride - 1 - int(newline > 0 and raw[newline - 1] == ord("\r"))
+    unterminated = stride - cols if raw[-1] != ord("\n") else 0
+    rows, extra = divmod(len(raw) + unterminated, stride)
+    if extra or np.any(raw[stride - 1 :: stride] != ord("\n")):
+        raise ValueError("Grid rows must all have the same width")
+
+    view = np.lib.stride_tricks.as_strided(
+        raw, shape=(rows, cols), strides=(stride, 1), writeable=False
+    )
+
+    return view - ord("0") if digits else view
+
+
+def parse_ints(buffer: bytes | mmap.mmap | memoryview) -> np.ndarray:
+    """Parse `-?[0-9]+` runs from raw bytes into an int64 array, without regex."""
+    return _parse_ints(buffer)[0]
+
+
+def _parse_ints(
+    buffer: bytes | mmap.mmap | memoryview,
+) -> tuple[np.ndarray, np.ndarray]:
+    """`parse_ints`, along with the byte offset where each integer's digits start."""
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    is_digit = (raw >= ord("0")) & (raw <= ord("9"))
+    edges = np.flatnonzero(np.diff(is_digit, prepend=False, append=False))
+    starts, lengths = edges[::2], edges[1::2] - edges[::2]
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64), starts
+
+    if lengths.max() > MAX_INT_DIGITS:
+        raise ValueError(f"Integers longer than {MAX_INT_DIGITS} digits overflow")
+
+    digits = raw[is_digit].astype(np.int64) - ord("0")
+    ends = np.cumsum(lengths)
+    powers = np.repeat(ends - 1, lengths) - np.arange(len(digits))
+    values = np.add.reduceat(digits * _powers_of_ten()[powers], ends - lengths)
+
+    negative = np.zeros(len(starts), dtype=bool)
+    has_prefix = starts > 0
+    negative[has_prefix] = raw[starts[has_prefix] - 1] == ord("-")
+    values[negative] *= -1
+
+    return values, starts
+
+
+def load_input(year: int, day: int, test: bool = False, test_num: int = 1) -> InputFile:
+    return load(input_path(year, day, test=test, test_num=test_num))
+
+
+def input_path(year: int, day: int, test: bool = False, test_num: int = 1) -> Path:
     day_str = f"{day:02d}"
     if test and test_num >= 2:
         day_str += f"_{test_num}"
@@ -35,5 +270,18 @@ def read2(year: int, day: int, test: bool = False, test_num: int = 1) -> str:
     file = f"{day_str}.txt"
     dir_path = SAMPLE_DIR if test else INPUT_DIR
     path = dir_path / str(year) / file
+    _LAST_INPUT[year, day] = path
 
-    return path.read_text()
+    return path
+
+
+def input_digest(year: int, day: int) -> str | None:
+    """Content hash of the input most recently opened for `year` and `day`."""
+    path = _LAST_INPUT.get((year, day))
+
+    return load(path).digest if path is not None else None
+
+
+@cache
+def _powers_of_ten() -> np.ndarray:
+    return 10 ** np.arange(MAX_INT_DIGITS, dtype=np.int64)
@@ -0,0 +1,204 @@
+"""results.py
+
+Structured per-stage benchmark records, stored as JSONL or CSV, and comparison
+of a run against a baseline.
+"""
+
+import csv
+import hashlib
+import json
+import platform
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self, get_args, get_origin
+
+from advent_of_code import reader
+
+if TYPE_CHECKING:
+    from advent_of_code.tools import StageReport
+
+STATS = ("min", "median", "p95")
+
+
+@dataclass(frozen=True)
+class StageRecord:
+    year: int | None
+    day: int | None
+    part: int
+    name: str
+    input_hash: str | None
+    result_hash: str | None
+    python: str
+    repeats: int
+    min: float
+    median: float
+    p95: float
+    stdev: float
+    peak_memory: int | None
+    timestamp: str
+    net_memory: int | None = None
+    top_memory: tuple[tuple[str, int], ...] | None = None
+    cached: bool = False
+
+    @classmethod
+    def from_report(cls, report: "StageReport", result: Any) -> Self:
+        """Flatten a report; only part 1 and 2 answers are hashed."""
+        timing, memory, input_hash = report.timing, report.memory, None
+        if report.year is not None and report.day is not None:
+            input_hash = reader.input_digest(report.year, report.day)
+
+        return cls(
+            year=report.year,
+            day=report.day,
+            part=report.part,
+            name=report.name,
+            input_hash=input_hash,
+            result_hash=result_hash(result) if report.part != 0 else None,
+            python=f"{platform.python_implementation()} {platform.python_version()}",
+            repeats=len(timing.samples),
+            min=timing.min,
+            median=timing.median,
+            p95=timing.p95,
+            stdev=timing.stdev,
+            peak_memory=memory.peak if memory is not None else None,
+            timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            net_memory=memory.net if memory is not None else None,
+            top_memory=memory.top if memory is not None else None,
+            cached=report.cached,
+        )
+
+    @property
+    def key(self) -> tuple:
+        return self.year, self.day, self.part, self.name
+
+
+@dataclass(frozen=True)
+class Comparison:
+    baseline: StageRecord
+    current: StageRecord
+    change: float
+    regressed: bool
+
+    @property
+    def result_changed(self) -> bool:
+        return self.baseline.result_hash != self.current.result_hash
+
+    @property
+    def input_changed(self) -> bool:
+        return self.baseline.input_hash != self.current.input_hash
+
+
+def result_hash(result: Any) -> str:
+    return hashlib.blake2b(repr(result).encode(), digest_size=16).hexdigest()
+
+
+def append_record(path: Path, record: StageRecord) -> None:
+    """Append to a `.csv` file (header included when new) or else to JSONL."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".csv":
+        is_new = not path.exists() or path.stat().st_size == 0
+        with path.open("a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=[fd.name for fd in fields(record)])
+            if is_new:
+                writer.writeheader()
+            writer.writerow(_to_csv_row(record))
+    else:
+        with path.open("a") as f:
+            f.write(json.dumps(asdict(record)) + "\n")
+
+
+def load_records(path: Path) -> list[StageRecord]:
+    with path.open(newline="") as f:
+        if path.suffix == ".csv":
+            return [_from_csv_row(row) for row in csv.DictReader(f)]
+
+        return [_from_json(json.loads(line)) for line in f if line.strip()]
+
+
+def _from_json(values: dict[str, Any]) -> StageRecord:
+    if values.get("top_memory") is not None:
+        values["top_memory"] = tuple(map(tuple, values["top_memory"]))
+
+    return StageRecord(**values)
+
+
+def _to_csv_row(record: StageRecord) -> dict[str, Any]:
+    """`asdict`, with nested fields such as `top_memory` encoded as JSON."""
+    row = asdict(record)
+    for name, value in row.items():
+        if isinstance(value, (list, tuple)):
+            row[name] = json.dumps(value)
+
+    return row
+
+
+def _from_csv_row(row: dict[str, str]) -> StageRecord:
+    """Parse a row; columns newer than the file are left at their defaults."""
+    values: dict[str, Any] = {}
+    for fd in fields(StageRecord):
+        if fd.name not in row:
+            continue
+
+        raw, types = row[fd.name], get_args(fd.type) or (fd.type,)
+        if raw == "" and type(None) in types:
+            values[fd.name] = None
+        elif any(get_origin(t) is tuple for t in types):
+            values[fd.name] = json.loads(raw)
+        elif bool in types:
+            values[fd.name] = raw == "True"
+        else:
+            kind = next((t for t in (int, float) if t in types), str)
+            values[fd.name] = kind(raw)
+
+    return _from_json(values)
+
+
+def compare(
+    baseline: list[StageRecord],
+    current: list[StageRecord],
+    threshold: float = 0.1,
+    stat: str = "min",
+) -> list[Comparison]:
+    """Pair stages by year, day, part and name, using each file's latest record.
+
+    A stage regresses when `stat` grows by more than `threshold` (a fraction) or
+    its answer changes on the same input. Timings of stages loaded from the cache
+    on either side are not comparable, so those never regress on time alone.
+    """
+    if stat not in STATS:
+        raise ValueError(f"Unknown statistic: {stat=}")
+
+    latest = {record.key: record for record in baseline}
+    comparisons = []
+    for key, record in {record.key: record for record in current}.items():
+        base = latest.get(key)
+        if base is None:
+            continue
+
+        before, after = getattr(base, stat), getattr(record, stat)
+        change = (after - before) / before if before else 0.0
+        wrong = base.result_hash != record.result_hash
+        same_input = base.input_hash == record.input_hash
+        slower = change > threshold and not (base.cached or record.cached)
+        regressed = slower or (wrong and same_input)
+        comparisons.append(Comparison(base, record, change, regressed))
+
+    return comparisons
+
+
+def format_comparison(comparison: Comparison, stat: str = "min") -> str:
+    record = comparison.current
+    stage = f"{record.year} day {record.day} part {record.part} ({record.name})"
+    before, after = getattr(comparison.baseline, stat), getattr(record, stat)
+    line = f"{stage}: {before:.4f}s -> {after:.4f}s ({comparison.change:+.1%})"
+    if comparison.baseline.cached or record.cached:
+        line += " [cached]"
+    if comparison.input_changed:
+        line += " [input changed]"
+    elif comparison.result_changed:
+        line += " [result changed]"
+    if comparison.regressed:
+        line += " REGRESSION"
+
+    return line
@@ -0,0 +1,169 @@
+"""runner.py
+
+Discover puzzle modules on disk and run their `solve()` in a process pool.
+"""
+
+import importlib.util
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from advent_of_code import tools
+
+PUZZLES_DIR = Path() / "puzzles"
+
+# Loads a puzzle without importing the runner, so only the puzzle's imports count
+_IMPORT_PUZZLE = (
+    "import importlib.util, sys; "
+    "spec = importlib.util.spec_from_file_location('puzzle', sys.argv[1]); "
+    "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+)
+
+
+@dataclass
+class PuzzleRun:
+    path: Path
+    reports: list[tools.StageReport] = field(default_factory=list)
+    wall_time: float = 0.0
+    error: str | None = None
+
+
+def discover(
+    year: int, days: list[int] | None = None, root: Path = PUZZLES_DIR
+) -> list[Path]:
+    """Puzzle files for `year`, such as `01.py` or `10_star.py`, in day order."""
+    paths = [
+        path
+        for path in sorted((root / str(year)).glob("*.py"))
+        if path.stem[:2].isdigit() and (days is None or puzzle_day(path) in days)
+    ]
+
+    return sorted(paths, key=puzzle_day)
+
+
+def puzzle_day(path: Path) -> int:
+    return int(path.stem.split("_")[0])
+
+
+def load_puzzle(path: Path) -> Any:
+    """Import a puzzle file by path; its `__main__` block does not run.
+
+    The module is registered in `sys.modules` so that its classes can be pickled.
+    """
+    name = f"puzzle_{path.parent.name}_{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load puzzle module from {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def run_puzzle(path: Path) -> PuzzleRun:
+    """Load and solve one puzzle, collecting the reports of its stages."""
+    tools.REPORTS.clear()
+    run = PuzzleRun(path)
+    start_time = time.perf_counter()
+    try:
+        load_puzzle(path).solve()
+    except Exception as e:
+        run.error = f"{type(e).__name__}: {e}"
+
+    run.wall_time = time.perf_counter() - start_time
+    run.reports = list(tools.REPORTS)
+
+    return run
+
+
+def run_all(
+    paths: list[Path], jobs: int | None = None, options: dict | None = None
+) -> list[PuzzleRun]:
+    """Solve every puzzle in `paths` across `jobs` worker processes.
+
+    `options` are applied with `tools.configure` in each worker.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_configured_run, path, options or {}) for path in paths]
+        runs = []
+        for future in as_completed(futures):
+            run = future.result()
+            if run.error is not None:
+                tools.get_logger().error(f"{run.path} failed: {run.error}")
+            runs.append(run)
+
+    return sorted(runs, key=lambda run: puzzle_day(run.path))
+
+
+def _configured_run(path: Path, options: dict) -> PuzzleRun:
+    tools.configure(**options)
+
+    return run_puzzle(path)
+
+
+def format_summary(runs: list[PuzzleRun]) -> str:
+    header = (
+        f"{'Puzzle':<16} {'Part':>4} {'Stage':<32} {'Min':>9} {'Median':>9} "
+        f"{'Peak':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for run in runs:
+        for report in run.reports:
+            peak = tools.format_bytes(report.memory.peak) if report.memory else "-"
+            if report.cached:
+                peak = "cached"
+            lines.append(
+                f"{run.path.stem:<16} {report.part:>4} {report.name[:32]:<32} "
+                f"{report.timing.min:>8.4f}s {report.timing.median:>8.4f}s "
+                f"{peak:>10}"
+            )
+        if run.error is not None:
+            lines.append(f"{run.path.stem:<16} {'':>4} FAILED: {run.error}")
+
+    total = sum(report.timing.min for run in runs for report in run.reports)
+    lines.append("-" * len(header))
+    lines.append(f"{'Total':<16} {'':>4} {'':<32} {total:>8.4f}s")
+
+    return "\n".join(lines)
+
+
+def import_times(path: Path) -> dict[str, int]:
+    """Cumulative microseconds per top-level import made while loading `path`.
+
+    Measured in a fresh interpreter with `-X importtime`, so the figures include
+    interpreter startup but none of this process's already imported modules.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_PUZZLE, str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("   "):
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def format_import_times(paths: list[Path], top: int = 3) -> str:
+    header = f"{'Puzzle':<16} {'Imports':>10}  Heaviest"
+    lines = [header, "-" * 80]
+    for path in paths:
+        times = import_times(path)
+        heaviest = sorted(times.items(), key=lambda item: -item[1])[:top]
+        details = ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in heaviest)
+        lines.append(f"{path.stem:<16} {sum(times.values()) / 1000:>8.1f}ms  {details}")
+
+    return "\n".join(lines)
@@ -0,0 +1,241 @@
+"""segments.py"""
+
+from collections.abc import Iterator, Sequence
+from typing import Literal
+
+import numpy as np
+
+# Most cells `"dense"` rasterizes at once; taller boxes are done in row bands
+DENSE_LIMIT = 1 << 24
+
+# Overhead of one sweep event, in rasterized cells, when `"auto"` picks a method
+SWEEP_EVENT_COST = 2000
+
+# Most diagonal cells `_sweep_overlaps` expands at once
+SWEEP_CHUNK = 1 << 20
+
+
+def count_overlaps(
+    segments: np.ndarray | Sequence[Sequence[int]],
+    k: int = 2,
+    method: Literal["auto", "dense", "sweep"] = "auto",
+) -> int:
+    """Count cells covered by at least `k` segments.
+
+    Segments are `(a1, b1, a2, b2)` rows with inclusive endpoints, and must be
+    horizontal, vertical or 45 degree diagonals. `"dense"` accumulates coverage
+    in difference arrays over the bounding box, a band of rows at a time, so its
+    cost grows with the area. `"sweep"` only stops at rows where a segment
+    starts or ends, so its cost grows with the number of segments and the cells
+    on diagonals, not the coordinate range:
+
+    >>> count_overlaps([[0, 5, 10**12, 5], [0, 5, 10**12, 5]], method="sweep")
+    1000000000001
+
+    `"auto"` picks whichever should do less work.
+    """
+    segs = normalize(segments)
+    if not len(segs):
+        return 0
+
+    if method == "auto":
+        area = (np.ptp(segs[:, [0, 2]]) + 1) * (np.ptp(segs[:, [1, 3]]) + 1)
+        events = len(np.unique(np.concatenate((segs[:, 0], segs[:, 2] + 1))))
+        sweep_work = events * (len(segs) + SWEEP_EVENT_COST)
+        method = "dense" if area <= sweep_work else "sweep"
+
+    if method == "dense":
+        return sum(_dense_overlaps(band, k) for band in _row_bands(segs))
+
+    if method == "sweep":
+        return _sweep_overlaps(segs, k)
+
+    raise ValueError(f"Unknown overlap method: {method=}")
+
+
+def is_orthogonal(segments: np.ndarray) -> np.ndarray:
+    """Mask of segments that are horizontal or vertical."""
+    return (segments[:, 0] == segments[:, 2]) | (segments[:, 1] == segments[:, 3])
+
+
+def normalize(segments: np.ndarray | Sequence[Sequence[int]]) -> np.ndarray:
+    """Validate segments and order each one's endpoints by `(a, b)`."""
+    segs = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    da, db = segs[:, 2] - segs[:, 0], segs[:, 3] - segs[:, 1]
+    if np.any((da != 0) & (db != 0) & (np.abs(da) != np.abs(db))):
+        raise ValueError("Only horizontal, vertical and 45 degree segments are allowed")
+
+    flip = (da < 0) | ((da == 0) & (db < 0))
+    segs = segs.copy()
+    segs[flip] = segs[flip][:, [2, 3, 0, 1]]
+
+    return segs
+
+
+def _row_bands(segs: np.ndarray) -> Iterator[np.ndarray]:
+    """Segments clipped to successive bands of rows of at most `DENSE_LIMIT` cells."""
+    cols = int(np.ptp(segs[:, [1, 3]])) + 3
+    height = max(1, DENSE_LIMIT // cols)
+    steps = np.where(segs[:, 0] == segs[:, 2], 0, np.sign(segs[:, 3] - segs[:, 1]))
+    single_row = segs[:, 0] == segs[:, 2]
+    for top in range(int(segs[:, 0].min()), int(segs[:, 2].max()) + 1, height):
+        a1 = np.maximum(segs[:, 0], top)
+        a2 = np.minimum(segs[:, 2], top + height - 1)
+        b1 = segs[:, 1] + steps * (a1 - segs[:, 0])
+        b2 = np.where(single_row, segs[:, 3], segs[:, 1] + steps * (a2 - segs[:, 0]))
+        keep = a1 <= a2
+        if keep.any():
+            yield np.column_stack((a1, b1, a2, b2))[keep]
+
+
+def _dense_overlaps(segs: np.ndarray, k: int) -> int:
+    # Shift to the origin, leaving a spare column on the left for anti-diagonal ends
+    a_low, b_low = segs[:, [0, 2]].min(), segs[:, [1, 3]].min() - 1
+    a1, a2 = segs[:, 0] - a_low, segs[:, 2] - a_low
+    b1, b2 = segs[:, 1] - b_low, segs[:, 3] - b_low
+    rows, cols = int(a2.max()) + 2, int(max(b1.max(), b2.max())) + 2
+    db = np.sign(b2 - b1)
+    along_b, along_a = a1 == a2, (b1 == b2) & (a1 != a2)
+
+    # One zero column on the right, so diagonals can be summed in the flat buffer
+    counts = np.zeros((rows, cols + 1), dtype=np.int32)
+    diff = np.zeros((rows, cols + 1), dtype=np.int32)
+
+    _mark(diff, along_b, (a1, b1), (a2, b2 + 1))
+    counts += np.cumsum(diff, axis=1, dtype=np.int32)
+
+    diff[:] = 0
+    _mark(diff, along_a, (a1, b1), (a2 + 1, b2))
+    counts += np.cumsum(diff, axis=0, dtype=np.int32)
+
+    for step in (1, -1):
+        diff[:] = 0
+        _mark(diff, ~along_a & ~along_b & (db == step), (a1, b1), (a2 + 1, b2 + step))
+        counts += _diagonal_cumsum(diff, step)
+
+    return int(np.count_nonzero(counts >= k))
+
+
+def _diagonal_cumsum(diff: np.ndarray, step: int) -> np.ndarray:
+    """Running sums along `(i, j) -> (i + 1, j + step)`, vectorised.
+
+    In the row-major buffer that move is a fixed offset, so reshaping to rows of
+    that length turns every diagonal into a column. Each segment's end marker
+    zeroes its running sum before a diagonal wraps through the padding column.
+    """
+    rows, width = diff.shape
+    stride = width + step
+    flat = np.zeros(-(-diff.size // stride) * stride, dtype=diff.dtype)
+    flat[: diff.size] = diff.ravel()
+    summed = np.cumsum(flat.reshape(-1, stride), axis=0, dtype=diff.dtype)
+
+    return summed.ravel()[: diff.size].reshape(rows, width)
+
+
+def _mark(diff: np.ndarray, mask: np.ndarray, start: tuple, stop: tuple) -> None:
+    np.add.at(diff, (start[0][mask], start[1][mask]), 1)
+    np.add.at(diff, (stop[0][mask], stop[1][mask]), -1)
+
+
+def _sweep_overlaps(segs: np.ndarray, k: int) -> int:
+    # Fixed segments cover one interval of `b` per row; diagonals one moving cell
+    moving = (segs[:, 0] != segs[:, 2]) & (segs[:, 1] != segs[:, 3])
+    fixed, diag = segs[~moving], segs[moving]
+    lows_sorted, stops_sorted = np.sort(fixed[:, 1]), np.sort(fixed[:, 3] + 1)
+    steps = np.sign(diag[:, 3] - diag[:, 1])
+    b_low, b_span = int(segs[:, [1, 3]].min()), int(np.ptp(segs[:, [1, 3]])) + 1
+
+    # Coverage only changes where a segment starts or ends. Fixed intervals are
+    # tracked by their position in the sorted lows and stops, so selecting the
+    # active ones keeps them in order without sorting again
+    events = np.unique(np.concatenate((segs[:, 0], segs[:, 2] + 1)))
+    changes = [
+        _changes(fixed, np.argsort(fixed[:, 1], kind="stable"), events),
+        _changes(fixed, np.argsort(fixed[:, 3], kind="stable"), events),
+        _changes(diag, np.arange(len(diag)), events),
+    ]
+    on_low = np.zeros(len(fixed), dtype=bool)
+    on_stop = np.zeros(len(fixed), dtype=bool)
+    on_diag = np.zeros(len(diag), dtype=bool)
+    total, rows = 0, events.tolist()
+    for e, (row, next_row) in enumerate(zip(rows, rows[1:])):
+        for on, (starting, stopping) in zip((on_low, on_stop, on_diag), changes):
+            on[stopping[e]] = False
+            on[starting[e]] = True
+
+        bounds, depth = _profile(lows_sorted[on_low], stops_sorted[on_stop])
+        total += (next_row - row) * int(np.diff(bounds)[depth[:-1] >= k].sum())
+
+        active = np.flatnonzero(on_diag)
+        if not len(active):
+            continue
+
+        for keys in _diagonal_cells(
+            diag[active], steps[active], row, next_row, b_low, b_span
+        ):
+            # Only cells the diagonals lift from below `k` to `k` or more are new
+            packed, counts = np.unique(keys, return_counts=True)
+            static = _depth_at(packed % b_span + b_low, bounds, depth)
+            total += int(np.count_nonzero((static < k) & (static + counts >= k)))
+
+    return total
+
+
+def _changes(
+    part: np.ndarray, order: np.ndarray, events: np.ndarray
+) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """Positions in `order` of the segments that start, and stop, at each event."""
+    position = np.empty(len(order), dtype=np.int64)
+    position[order] = np.arange(len(order))
+    by_start = np.argsort(part[:, 0], kind="stable")
+    by_stop = np.argsort(part[:, 2], kind="stable")
+    start_at = np.searchsorted(part[by_start, 0], events).tolist()
+    stop_at = np.searchsorted(part[by_stop, 2] + 1, events).tolist()
+    starting = [position[by_start[i:j]] for i, j in zip(start_at, start_at[1:])]
+    stopping = [position[by_stop[i:j]] for i, j in zip(stop_at, stop_at[1:])]
+
+    return starting, stopping
+
+
+def _profile(lows: np.ndarray, stops: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Coverage of the intervals `[low, stop)` as breakpoints and depths.
+
+    `depth[i]` holds from `bounds[i]` up to `bounds[i + 1]`; both inputs are
+    sorted, so the stable sort is a linear merge.
+    """
+    bounds = np.concatenate((lows, stops))
+    order = np.argsort(bounds, kind="stable")
+    depth = np.cumsum(np.where(order < len(lows), 1, -1))
+
+    return bounds[order], depth
+
+
+def _depth_at(points: np.ndarray, bounds: np.ndarray, depth: np.ndarray) -> np.ndarray:
+    if not len(depth):
+        return np.zeros(len(points), dtype=np.int64)
+
+    idx = np.searchsorted(bounds, points, "right") - 1
+
+    return np.where(idx >= 0, depth[np.maximum(idx, 0)], 0)
+
+
+def _diagonal_cells(
+    starts: np.ndarray,
+    steps: np.ndarray,
+    row: int,
+    next_row: int,
+    b_low: int,
+    b_span: int,
+) -> Iterator[np.ndarray]:
+    """Blocks of the diagonals' cells in rows `[row, next_row)`.
+
+    Cells are packed as `row offset * b_span + (b - b_low)`, so equal keys are the
+    same cell. Blocks bound both memory and the packed values.
+    """
+    size = min(max(1, SWEEP_CHUNK // len(starts)), max(1, (1 << 62) // b_span))
+    for first in range(row, next_row, size):
+        offsets = np.arange(min(size, next_row - first))
+        cells = starts[:, 1, None] + steps[:, None] * (
+            offsets + (first - starts[:, 0, None])
+        )
+        yield (offsets * b_span + (cells - b_low)).ravel()
@@ -0,0 +1,358 @@
+"""synthetic.py
+
+Seeded generators of valid, arbitrarily large puzzle inputs for benchmarking.
+"""
+
+import itertools as it
+import os
+import random
+import string
+from collections.abc import Callable
+from math import isqrt
+from pathlib import Path
+
+from advent_of_code import grid_utils as gru
+from advent_of_code import reader
+from advent_of_code.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+InputGenerator = Callable[[random.Random, int], str]
+
+SEVEN_SEGMENT_DIGITS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+BRACKETS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+POLYMER_ELEMENTS = "BCFHKNOPSV"
+# Longest basin side; two half-widths must stay below the 9s of the walls
+BASIN_WIDTH = 9
+
+
+def write_input(
+    year: int, day: int, size: int, seed: int = 0, test: bool = False
+) -> Path:
+    """Generate an input and write it where `reader.read2` will look for it.
+
+    The file is replaced rather than rewritten in place, so arrays still viewing
+    a memory map of the previous input (see `reader.load`) stay valid.
+    """
+    generator = get_generator(year, day)
+    path = reader.input_path(year, day, test=test)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(f".{os.getpid()}.tmp")
+    partial.write_text(generator(random.Random(seed), size))
+    partial.replace(path)
+
+    return path
+
+
+def get_generator(year: int, day: int) -> InputGenerator:
+    try:
+        return GENERATORS[year][day]
+    except KeyError:
+        raise ValueError(f"No input generator for {year} day {day}") from None
+
+
+# --- 2021 --- #
+
+
+def sonar_sweep(rng: random.Random, size: int) -> str:
+    """`size` depth readings."""
+    depth, depths = 100, []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(depth)
+
+    return "\n".join(map(str, depths)) + "\n"
+
+
+def dive(rng: random.Random, size: int) -> str:
+    """`size` submarine commands."""
+    commands = rng.choices(["forward", "down", "up"], weights=[2, 2, 1], k=size)
+
+    return "".join(f"{cmd} {rng.randint(1, 9)}\n" for cmd in commands)
+
+
+def binary_diagnostic(rng: random.Random, size: int) -> str:
+    """`size` binary numbers, at least 12 bits wide.
+
+    Any two numbers sharing a prefix differ in the very next bit, so the bit
+    criteria filters never empty out before one number is left.
+    """
+    width = max(12, size.bit_length() + 1)
+    numbers = _branching_numbers(rng, "", size, width)
+    rng.shuffle(numbers)
+
+    return "".join(f"{n}\n" for n in numbers)
+
+
+def _branching_numbers(
+    rng: random.Random, prefix: str, count: int, width: int
+) -> list[str]:
+    remaining = width - len(prefix)
+    if count == 1:
+        return [prefix + "".join(rng.choices("01", k=remaining))]
+
+    capacity = 2 ** (remaining - 1)
+    zeros = rng.randint(max(1, count - capacity), min(count - 1, capacity))
+
+    low = _branching_numbers(rng, prefix + "0", zeros, width)
+    high = _branching_numbers(rng, prefix + "1", count - zeros, width)
+
+    return low + high
+
+
+def giant_squid(rng: random.Random, size: int) -> str:
+    """`size` bingo boards drawn from the numbers 0-99."""
+    calls = rng.sample(range(100), 100)
+    boards = []
+    for _ in range(size):
+        cells = rng.sample(range(100), 25)
+        rows = (" ".join(f"{n:2d}" for n in cells[i : i + 5]) for i in range(0, 25, 5))
+        boards.append("\n".join(rows))
+
+    return ",".join(map(str, calls)) + "\n\n" + "\n\n".join(boards) + "\n"
+
+
+def hydrothermal_venture(rng: random.Random, size: int) -> str:
+    """`size` horizontal, vertical or diagonal vent lines."""
+    bound = 1000 * max(1, isqrt(size // 500))
+    lines = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(bound), rng.randrange(bound)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        dx, dy = rng.choice([(dx, dy), (-dx, -dy)])
+        room_x = bound - 1 - x1 if dx > 0 else x1 if dx < 0 else bound
+        room_y = bound - 1 - y1 if dy > 0 else y1 if dy < 0 else bound
+        length = rng.randint(0, min(room_x, room_y, bound // 2))
+        lines.append(f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}")
+
+    return "\n".join(lines) + "\n"
+
+
+def lanternfish(rng: random.Random, size: int) -> str:
+    """`size` fish timers."""
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size)) + "\n"
+
+
+def treachery_of_whales(rng: random.Random, size: int) -> str:
+    """`size` crab positions."""
+    spread = max(2000, size)
+
+    return ",".join(str(rng.randrange(spread)) for _ in range(size)) + "\n"
+
+
+def seven_segment_search(rng: random.Random, size: int) -> str:
+    """`size` scrambled displays."""
+    lines = []
+    for _ in range(size):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        def scramble(digit: str) -> str:
+            wires = [wiring[segment] for segment in digit]
+            return "".join(rng.sample(wires, len(wires)))
+
+        patterns = [scramble(d) for d in rng.sample(SEVEN_SEGMENT_DIGITS, 10)]
+        shown = [scramble(rng.choice(SEVEN_SEGMENT_DIGITS)) for _ in range(4)]
+        lines.append(f"{' '.join(patterns)} | {' '.join(shown)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def smoke_basin(rng: random.Random, size: int) -> str:
+    """A `size` x `size` height map of rectangular basins walled in by 9s.
+
+    Heights rise by one per step away from each basin's single low point, so
+    every other cell has a strictly lower neighbor and belongs to one basin.
+    """
+    heights = [[9] * size for _ in range(size)]
+    for top, rows in _wall_spans(rng, size):
+        for left, cols in _wall_spans(rng, size):
+            low_i, low_j = _basin_center(rng, rows), _basin_center(rng, cols)
+            rise = max(low_i, rows - 1 - low_i) + max(low_j, cols - 1 - low_j)
+            base = rng.randint(0, 8 - rise)
+            for i in range(rows):
+                heights[top + i][left : left + cols] = [
+                    base + abs(i - low_i) + abs(j - low_j) for j in range(cols)
+                ]
+
+    return "".join("".join(map(str, row)) + "\n" for row in heights)
+
+
+def _wall_spans(rng: random.Random, size: int) -> list[tuple[int, int]]:
+    """`(start, length)` runs of at least two cells, each followed by a wall."""
+    spans, start = [], 0
+    while size - start >= 2:
+        length = min(rng.randint(2, BASIN_WIDTH), size - start)
+        spans.append((start, length))
+        start += length + 1
+
+    return spans
+
+
+def _basin_center(rng: random.Random, length: int) -> int:
+    """A low point at most `BASIN_WIDTH // 2` cells from either end of the run."""
+    reach = BASIN_WIDTH // 2
+
+    return rng.randint(max(0, length - 1 - reach), min(length - 1, reach))
+
+
+def syntax_scoring(rng: random.Random, size: int) -> str:
+    """`size` chunk lines, an odd number of them incomplete and the rest corrupt."""
+    incomplete = (size // 2) | 1
+    kinds = [True] * incomplete + [False] * (size - incomplete)
+    rng.shuffle(kinds)
+
+    return "".join(_chunk_line(rng, is_incomplete) + "\n" for is_incomplete in kinds)
+
+
+def _chunk_line(rng: random.Random, incomplete: bool) -> str:
+    length = rng.randint(20, 110)
+    corrupt_at = -1 if incomplete else rng.randrange(length)
+    chars, stack = [], []
+    for k in range(length):
+        if k == corrupt_at:
+            expected = BRACKETS[stack[-1]] if stack else None
+            chars.append(rng.choice([c for c in BRACKETS.values() if c != expected]))
+            break
+
+        if stack and rng.random() < 0.45:
+            chars.append(BRACKETS[stack.pop()])
+        else:
+            stack.append(rng.choice(list(BRACKETS)))
+            chars.append(stack[-1])
+
+    if incomplete and not stack:
+        chars.append(rng.choice(list(BRACKETS)))
+
+    return "".join(chars)
+
+
+def dumbo_octopus(rng: random.Random, size: int) -> str:
+    """A `size` x `size` energy grid that synchronises on its first flash.
+
+    Random grids almost never synchronise, and rejecting them costs a long
+    simulation each. Instead, low cells are raised until each has at least as
+    many higher neighbors as it is below the top energy. When the top cells
+    flash, the cascade then reaches every cell often enough to fire it. The
+    trade-off is a short part 2: the grid synchronises on step `10 - top`.
+    """
+    top = rng.randint(4, 9)
+    energy = np.array(rng.choices(range(top + 1), k=size * size)).reshape(size, size)
+    while True:
+        above = np.stack([gru.neighbor_sum(energy > level) for level in range(top + 1)])
+        higher = np.take_along_axis(above, energy[np.newaxis], axis=0)[0]
+        short = higher < top - energy
+        if not short.any():
+            break
+
+        energy[short] += 1
+
+    return "".join("".join(map(str, row)) + "\n" for row in energy.tolist())
+
+
+def passage_pathing(rng: random.Random, size: int) -> str:
+    """A cave system of `size` caves, with no two big caves adjacent.
+
+    Path counts grow exponentially with `size`, so keep it small.
+    """
+    names = ["".join(p) for p in it.product(string.ascii_lowercase, repeat=2)]
+    small = rng.sample(names, max(2, size - size // 4))
+    big = [name.upper() for name in rng.sample(names, max(1, size // 4))]
+    caves = rng.sample(small + big, len(small) + len(big))
+
+    edges = set()
+    for k, cave in enumerate(caves):
+        for other in rng.sample(caves[:k], min(k, 2)):
+            if not (cave.isupper() and other.isupper()):
+                edges.add((other, cave))
+
+        if not any(cave in edge for edge in edges):
+            edges.add((rng.choice([c for c in small if c != cave]), cave))
+
+    edges.add(("start", caves[0]))
+    edges.add(("start", rng.choice(small)))
+    edges.add((caves[-1], "end"))
+    edges.add((rng.choice(small), "end"))
+
+    return "".join(f"{a}-{b}\n" for a, b in sorted(edges))
+
+
+def transparent_origami(rng: random.Random, size: int) -> str:
+    """`size` dots on paper that folds down to a 40 x 6 code."""
+    folds_x, folds_y = 1, 1
+    while _unfolded(40, folds_x) * _unfolded(6, folds_y) < 4 * size:
+        if folds_x <= folds_y:
+            folds_x += 1
+        else:
+            folds_y += 1
+
+    width, height = _unfolded(40, folds_x), _unfolded(6, folds_y)
+    lines_x = [(width >> (k + 1)) for k in range(folds_x)]
+    lines_y = [(height >> (k + 1)) for k in range(folds_y)]
+    dots: set[tuple[int, int]] = set()
+    while len(dots) < size:
+        x, y = rng.randrange(width), rng.randrange(height)
+        if x not in lines_x and y not in lines_y:
+            dots.add((x, y))
+
+    folds = [
+        f"fold along {axis}={line}"
+        for pair in it.zip_longest(lines_x, lines_y)
+        for axis, line in zip("xy", pair)
+        if line is not None
+    ]
+
+    return "".join(f"{x},{y}\n" for x, y in dots) + "\n" + "\n".join(folds) + "\n"
+
+
+def _unfolded(final: int, folds: int) -> int:
+    return (final + 1) * 2**folds - 1
+
+
+def extended_polymerization(rng: random.Random, size: int) -> str:
+    """A `size` element template with a rule for every element pair."""
+    template = "".join(rng.choices(POLYMER_ELEMENTS, k=size))
+    rules = [
+        f"{a}{b} -> {rng.choice(POLYMER_ELEMENTS)}"
+        for a, b in it.product(POLYMER_ELEMENTS, repeat=2)
+    ]
+
+    return template + "\n\n" + "\n".join(rules) + "\n"
+
+
+def chiton(rng: random.Random, size: int) -> str:
+    """A `size` x `size` risk map."""
+    return "".join(
+        "".join(str(rng.randint(1, 9)) for _ in range(size)) + "\n" for _ in range(size)
+    )
+
+
+GENERATORS: dict[int, dict[int, InputGenerator]] = {
+    2021: {
+        1: sonar_sweep,
+        2: dive,
+        3: binary_diagnostic,
+        4: giant_squid,
+        5: hydrothermal_venture,
+        6: lanternfish,
+        7: treachery_of_whales,
+        8: seven_segment_search,
+        9: smoke_basin,
+        10: syntax_scoring,
+        11: dumbo_octopus,
+        12: passage_pathing,
+        13: transparent_origami,
+        14: extended_polymerization,
+        15: chiton,
+    },
+}
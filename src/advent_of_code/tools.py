@@ -1,19 +1,145 @@
+from __future__ import annotations
+
 import functools
+import gc
+import itertools as it
+import os
 import sys
 import time
-from typing import Any, Callable, Literal
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Literal, Self
+
+from advent_of_code import reader
+from advent_of_code.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from loguru import Logger
 
-from loguru import logger
+    from advent_of_code.profiling import ProfileMode
+
+# Only needed once a stage runs, or with a benchmark option enabled
+statistics = lazy_import("statistics")
+tracemalloc = lazy_import("tracemalloc")
+cache = lazy_import("advent_of_code.cache")
+profiling = lazy_import("advent_of_code.profiling")
+results = lazy_import("advent_of_code.results")
 
 PART = Literal[0, 1, 2]
 
 
-logger.remove()
-logger.add(
-    sys.stdout,
-    colorize=True,
-    format="<green>{time:HH:mm:ss}</green> | <level>{message}</level>",
-)
+@functools.cache
+def get_logger() -> Logger:
+    """Loguru's logger, with the console sink set up on first use."""
+    from loguru import logger
+
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        colorize=True,
+        format="<green>{time:HH:mm:ss}</green> | <level>{message}</level>",
+    )
+
+    return logger
+
+
+def __getattr__(name: str) -> Any:
+    if name == "logger":
+        return get_logger()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() not in ("", "0", "false", "no")
+
+
+@dataclass
+class BenchmarkConfig:
+    """How `solution` runs each stage; the defaults time a single call."""
+
+    repeats: int = 1
+    warmup: int = 0
+    disable_gc: bool = False
+    memory: bool = False
+    profile: ProfileMode | None = None
+    profile_dir: str = "profiles"
+    results: str | None = None
+    cache: bool = False
+
+    @classmethod
+    def from_env(cls) -> Self:
+        return cls(
+            repeats=int(os.environ.get("AOC_REPEATS", 1)),
+            warmup=int(os.environ.get("AOC_WARMUP", 0)),
+            disable_gc=_env_flag("AOC_DISABLE_GC"),
+            memory=_env_flag("AOC_MEMORY"),
+            profile=os.environ.get("AOC_PROFILE") or None,
+            profile_dir=os.environ.get("AOC_PROFILE_DIR", "profiles"),
+            results=os.environ.get("AOC_RESULTS") or None,
+            cache=_env_flag("AOC_CACHE"),
+        )
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    samples: tuple[float, ...]
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        if len(self.samples) < 2:
+            return self.samples[0]
+
+        return statistics.quantiles(self.samples, n=20, method="inclusive")[-1]
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) >= 2 else 0.0
+
+
+@dataclass(frozen=True)
+class MemoryStats:
+    """`tracemalloc` figures for one call; `top` holds `(site, bytes)` pairs."""
+
+    peak: int
+    net: int
+    top: tuple[tuple[str, int], ...]
+
+
+@dataclass
+class StageReport:
+    module: str
+    name: str
+    part: int
+    timing: TimingStats
+    memory: MemoryStats | None = None
+    profile: Path | None = None
+    year: int | None = None
+    day: int | None = None
+    cached: bool = False
+
+
+CONFIG = BenchmarkConfig.from_env()
+REPORTS: list[StageReport] = []
+
+
+def configure(**options: Any) -> None:
+    """Override `CONFIG` fields, e.g. `configure(repeats=20, warmup=2)`."""
+    names = {f.name for f in fields(CONFIG)}
+    for name, value in options.items():
+        if name not in names:
+            raise ValueError(f"Unknown benchmark option: {name=}")
+
+        setattr(CONFIG, name, value)
 
 
 def solution(part: int, log_result: bool = True) -> Callable[..., Any]:
@@ -22,21 +148,199 @@ def solution(part: int, log_result: bool = True) -> Callable[..., Any]:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.perf_counter()
-            result = func(*args, **kwargs)
-            duration = time.perf_counter() - start_time
+            key = _cache_key(func, part)
+            if key is not None:
+                start_time = time.perf_counter()
+                result = cache.load(key)
+                if result is not cache.MISSING:
+                    timing = TimingStats((time.perf_counter() - start_time,))
+                    report = StageReport(
+                        func.__module__,
+                        func.__qualname__,
+                        part,
+                        timing,
+                        year=func.__globals__.get("YEAR"),
+                        day=func.__globals__.get("DAY"),
+                        cached=True,
+                    )
+                    _record(report, result)
+                    logger = get_logger()
+                    logger.info(f"Data loaded from cache in {format_timing(timing)}")
+                    return result
+
+            stem = Path(CONFIG.profile_dir) / stage_name(func, part)
+            result, timing, memory, profile = measure(func, args, kwargs, CONFIG, stem)
+            report = StageReport(
+                func.__module__,
+                func.__qualname__,
+                part,
+                timing,
+                memory,
+                profile,
+                func.__globals__.get("YEAR"),
+                func.__globals__.get("DAY"),
+            )
+            _record(report, result)
 
             part_str = "Data processed" if part == 0 else f"Part {part} executed"
 
             # Log with level 'INFO' for visibility
-            msg = f"{part_str} in {duration:.4f}s"
+            msg = f"{part_str} in {format_timing(timing)}"
+            if memory is not None:
+                msg += f" | {format_memory(memory)}"
             if log_result and part != 0:
                 msg += f" | Result: {result}"
 
+            logger = get_logger()
             logger.info(msg)
+            for site, size in memory.top if memory is not None else ():
+                logger.debug(f"  {format_bytes(size)} at {site}")
+            if profile is not None:
+                logger.info(f"Profile written to {profile}")
+            if key is not None and not cache.store(key, result):
+                logger.debug(f"Cannot cache {func.__qualname__}: result not picklable")
 
             return result
 
         return wrapper
 
     return decorator
+
+
+def _record(report: StageReport, result: Any) -> None:
+    """Keep `report`, and append it to the results file when one is configured."""
+    REPORTS.append(report)
+    if CONFIG.results is not None:
+        record = results.StageRecord.from_report(report, result)
+        results.append_record(Path(CONFIG.results), record)
+
+
+def _cache_key(func: Callable, part: int) -> str | None:
+    """Cache key for a `part=0` stage, once its puzzle's input has been opened."""
+    year, day = func.__globals__.get("YEAR"), func.__globals__.get("DAY")
+    if part != 0 or not CONFIG.cache or year is None or day is None:
+        return None
+
+    digest = reader.input_digest(year, day)
+
+    return cache.stage_key(func, digest) if digest is not None else None
+
+
+def stage_name(func: Callable, part: int) -> str:
+    """`{year}_{day:02d}_part{part}` from the puzzle's `YEAR` and `DAY` globals."""
+    year, day = func.__globals__.get("YEAR"), func.__globals__.get("DAY")
+    if year is None or day is None:
+        return f"{func.__module__}_{func.__qualname__}_part{part}"
+
+    return f"{year}_{day:02d}_part{part}"
+
+
+def measure(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    config: BenchmarkConfig,
+    profile_path: Path | None = None,
+) -> tuple[Any, TimingStats, MemoryStats | None, Path | None]:
+    """Call `func` `warmup` times untimed, then time `repeats` calls.
+
+    With `config.memory` set, one further call runs under `tracemalloc`, and with
+    `config.profile` set another runs under the profiler and is written next to
+    `profile_path`, so their overhead stays out of the timings. When calling
+    more than once, one-shot iterator arguments (such as streamed input lines)
+    are materialized up front so every call sees the same data.
+    """
+    extra_calls = config.memory + (config.profile is not None)
+    if config.warmup + config.repeats + extra_calls > 1:
+        args = tuple(_replayable(arg) for arg in args)
+        kwargs = {key: _replayable(arg) for key, arg in kwargs.items()}
+
+    for _ in range(config.warmup):
+        func(*args, **kwargs)
+
+    gc_was_enabled = gc.isenabled()
+    if config.disable_gc:
+        gc.collect()
+        gc.disable()
+
+    samples = []
+    try:
+        for _ in range(max(1, config.repeats)):
+            start_time = time.perf_counter()
+            result = func(*args, **kwargs)
+            samples.append(time.perf_counter() - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    memory = trace_memory(func, args, kwargs) if config.memory else None
+
+    profile = None
+    if config.profile is not None:
+        path = profile_path or Path(config.profile_dir) / func.__qualname__
+        profile = profiling.profile_call(func, args, kwargs, config.profile, path)
+
+    return result, TimingStats(tuple(samples)), memory, profile
+
+
+def trace_memory(
+    func: Callable, args: tuple, kwargs: dict, top: int = 5
+) -> MemoryStats:
+    """Peak and net bytes allocated by one call, with its largest net sites."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start_size = tracemalloc.get_traced_memory()[0]
+
+        result = func(*args, **kwargs)
+
+        size, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    del result
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    before, after = before.filter_traces(ignore), after.filter_traces(ignore)
+    grown = (diff for diff in after.compare_to(before, "lineno") if diff.size_diff > 0)
+    sites = tuple(
+        (f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}", diff.size_diff)
+        for diff in it.islice(grown, top)
+    )
+
+    return MemoryStats(peak - start_size, size - start_size, sites)
+
+
+def _replayable(arg: Any) -> Any:
+    return list(arg) if isinstance(arg, Iterator) else arg
+
+
+def format_timing(timing: TimingStats) -> str:
+    if len(timing.samples) == 1:
+        return f"{timing.min:.4f}s"
+
+    return (
+        f"{timing.min:.4f}s (median {timing.median:.4f}s, p95 {timing.p95:.4f}s, "
+        f"stdev {timing.stdev:.4f}s, n={len(timing.samples)})"
+    )
+
+
+def format_memory(memory: MemoryStats) -> str:
+    return f"peak {format_bytes(memory.peak)}, net {format_bytes(memory.net)}"
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+    return f"{size:.1f} GiB"